@@ -1,3 +1,6 @@
 from .dynarray import DynamicArray
+from .gapbuffer import GapBuffer
+from .mmaparray import MappedArray
+from .pvector import PersistentVector, TransientVector
 
-__all__ = ['DynamicArray']
+__all__ = ['DynamicArray', 'GapBuffer', 'MappedArray', 'PersistentVector', 'TransientVector']
@@ -1,15 +1,46 @@
 import ctypes
 
+# typecodes accepted for native storage, mapped to their ctypes element type
+_TYPECODES = {
+    'b': ctypes.c_byte,
+    'B': ctypes.c_ubyte,
+    'h': ctypes.c_short,
+    'H': ctypes.c_ushort,
+    'i': ctypes.c_int,
+    'I': ctypes.c_uint,
+    'l': ctypes.c_long,
+    'L': ctypes.c_ulong,
+    'q': ctypes.c_longlong,
+    'Q': ctypes.c_ulonglong,
+    'f': ctypes.c_float,
+    'd': ctypes.c_double,
+}
+# integer typecodes, whose ctypes stores wrap around instead of overflowing
+_INTEGER_TYPECODES = 'bBhHiIlLqQ'
+
 
 class DynamicArray:
     """
     A dynamic array class akin to a simplified Python list.
+
+    With a typecode (as used by the struct and array modules, e.g. 'd', 'q'
+    or 'B') elements are kept unboxed in a contiguous native buffer that can
+    be shared without copying through memoryview().
     """
 
-    def __init__(self):
+    def __init__(self, typecode=None):
         """
         Create an empty array.
+        Elements are arbitrary objects unless typecode is given.
         """
+        if typecode is None:
+            # references to arbitrary objects
+            self._ctype = ctypes.py_object
+        elif typecode in _TYPECODES:
+            self._ctype = _TYPECODES[typecode]
+        else:
+            raise ValueError('bad typecode (must be one of ' + ''.join(_TYPECODES) + ')')
+        self._typecode = typecode
         # count actual elements
         self._n = 0
         # default array capacity
@@ -25,17 +56,63 @@ class DynamicArray:
 
     def __getitem__(self, k):
         """
-        Return element at index k.
+        Return element at index k, or a new array for a slice k.
         """
+        if isinstance(k, slice):
+            start, stop, step = k.indices(self._n)
+            result = DynamicArray(self._typecode)
+            if step == 1:
+                if start < stop:
+                    result._resize(stop - start)
+                    result._copy_block(self._A, start, 0, stop - start)
+                    result._n = stop - start
+            else:
+                result.extend([self._A[j] for j in range(start, stop, step)])
+            return result
         if not 0 <= k < self._n:
             raise IndexError('invalid index')
         # retrieve from array
         return self._A[k]
 
+    def __setitem__(self, k, value):
+        """
+        Replace element at index k, or the elements of slice k with an iterable.
+        A slice with step 1 may change the length of the array.
+        """
+        if not isinstance(k, slice):
+            if not 0 <= k < self._n:
+                raise IndexError('invalid index')
+            self._A[k] = self._check(value)
+            return
+        start, stop, step = k.indices(self._n)
+        values = self._convert(value)
+        if step != 1:
+            targets = range(start, stop, step)
+            if len(values) != len(targets):
+                raise ValueError('attempt to assign sequence of size {0} to extended slice of size {1}'
+                                 .format(len(values), len(targets)))
+            for j, v in zip(targets, values):
+                self._A[j] = v
+            return
+        # an empty slice still marks the insertion point
+        stop = max(start, stop)
+        delta = len(values) - (stop - start)
+        if delta > 0:
+            self._reserve(delta)
+        # move the tail once to open (or close) the room for values
+        self._copy_block(self._A, stop, stop + delta, self._n - stop)
+        self._copy_block(values, 0, start, len(values))
+        if delta < 0:
+            self._clear(self._n + delta, self._n)
+        self._n += delta
+        if delta < 0:
+            self._shrink()
+
     def append(self, obj):
         """
         Add object to end of the array.
         """
+        obj = self._check(obj)
         # not enough room
         if self._n == self._capacity:
             # so double capacity
@@ -43,57 +120,201 @@ class DynamicArray:
         self._A[self._n] = obj
         self._n += 1
 
+    def extend(self, iterable):
+        """
+        Add all elements of iterable to end of the array.
+        """
+        values = self._convert(iterable)
+        self._reserve(len(values))
+        # one block store instead of repeated appends
+        self._copy_block(values, 0, self._n, len(values))
+        self._n += len(values)
+
+    def _check(self, value):
+        """
+        Return value if the storage can hold it exactly.
+        Raise TypeError for a value of the wrong type, OverflowError for an out-of-range integer.
+        """
+        if self._typecode is None:
+            return value
+        # ctypes rejects wrong types but silently truncates integers
+        if self._ctype(value).value != value and self._typecode in _INTEGER_TYPECODES:
+            raise OverflowError('value {0!r} out of range for typecode {1!r}'.format(value, self._typecode))
+        return value
+
+    def _convert(self, iterable):
+        """
+        Return the elements of iterable as a block ready to copy into the storage.
+        Raise TypeError or OverflowError, as _check does, before anything is stored.
+        """
+        values = list(iterable)
+        if self._typecode is None:
+            return values
+        # a temporary native buffer converts (and type-checks) every value at once
+        block = (len(values) * self._ctype)()
+        block[:] = values
+        if self._typecode in _INTEGER_TYPECODES and block[:] != values:
+            for v in values:
+                self._check(v)
+        return block
+
     def _resize(self, c):
         """
         Resize internal array to capacity c.
         """
         # new(bigger) array
         bigger = self._make_array(c)
-        # for each existing value
-        for k in range(self._n):
-            bigger[k] = self._A[k]
+        # copy existing values as a single block
+        self._copy_block(self._A, 0, 0, self._n, bigger)
         # use the bigger array
         self._A = bigger
         self._capacity = c
 
+    def _reserve(self, m):
+        """
+        Make room for m more elements, at least doubling capacity when growing.
+        """
+        if self._n + m > self._capacity:
+            self._resize(max(2 * self._capacity, self._n + m))
+
+    def _shrink(self):
+        """
+        Halve capacity once the array falls below a quarter full.
+        """
+        if self._n < self._capacity // 4:
+            self._resize(max(self._capacity // 2, 1))
+
+    def _copy_block(self, src, i, j, count, dest=None):
+        """
+        Copy count slots from src[i:] to dest[j:] (dest defaults to the array).
+        Overlapping ranges are handled correctly.
+        """
+        if count <= 0:
+            return
+        if dest is None:
+            dest = self._A
+        if self._typecode is None:
+            # list slice assignment moves the references as one block
+            dest[j:j + count] = src[i:i + count]
+        else:
+            size = ctypes.sizeof(self._ctype)
+            ctypes.memmove(ctypes.addressof(dest) + j * size, ctypes.addressof(src) + i * size, count * size)
+
+    def _clear(self, i, j):
+        """
+        Drop references held by the unused slots i to j-1.
+        """
+        if self._typecode is None and i < j:
+            # help garbage collection
+            self._A[i:j] = [None] * (j - i)
+
     def _make_array(self, c):
         """
         Return new array with capacity c.
         """
+        if self._typecode is None:
+            # a preallocated list of references: ctypes py_object slots do
+            # per-slot keep-alive bookkeeping that makes block moves slow
+            return [None] * c
         # see ctypes documentation
-        return (c * ctypes.py_object)()
+        return (c * self._ctype)()
+
+    @property
+    def typecode(self):
+        """
+        Typecode of the native storage (None for object storage).
+        """
+        return self._typecode
+
+    @property
+    def itemsize(self):
+        """
+        Size in bytes of one slot of the underlying array.
+        """
+        return ctypes.sizeof(self._ctype)
+
+    def memoryview(self):
+        """
+        Return a zero-copy memoryview over the stored elements.
+        The view stays attached to the current storage, so it goes stale once
+        the array is resized; take a fresh one after growing the array.
+        """
+        if self._typecode is None:
+            raise TypeError('object storage does not support the buffer protocol')
+        # ctypes exports an explicit-endian format; recast to the native typecode
+        return memoryview(self._A).cast('B').cast(self._typecode)[:self._n]
+
+    def __buffer__(self, flags):
+        """
+        Export the native storage through the buffer protocol (Python 3.12+).
+        """
+        return self.memoryview()
 
     def insert(self, k, value):
         """
         Insert value at index k, shifting subsequent values rightward.
         """
-        # (for simplicity, we assume 0 <= k <= n in this version)
+        if not 0 <= k <= self._n:
+            raise IndexError('invalid index')
+        # validate before anything moves
+        value = self._check(value)
         # not enough room
         if self._n == self._capacity:
             # so double capacity
             self._resize(2 * self._capacity)
-        # shift rightmost first
-        for j in range(self._n, k, -1):
-            self._A[j] = self._A[j - 1]
+        # shift subsequent values rightward as one block
+        self._copy_block(self._A, k, k + 1, self._n - k)
         # store newest element
         self._A[k] = value
         self._n += 1
 
+    def insert_many(self, k, iterable):
+        """
+        Insert all elements of iterable starting at index k.
+        """
+        if not 0 <= k <= self._n:
+            raise IndexError('invalid index')
+        values = self._convert(iterable)
+        m = len(values)
+        self._reserve(m)
+        self._copy_block(self._A, k, k + m, self._n - k)
+        self._copy_block(values, 0, k, m)
+        self._n += m
+
+    def delete_slice(self, start, stop):
+        """
+        Remove the elements at indices start to stop-1.
+        """
+        if not 0 <= start <= stop <= self._n:
+            raise IndexError('invalid slice')
+        m = stop - start
+        # shift others to fill gap
+        self._copy_block(self._A, stop, start, self._n - stop)
+        self._clear(self._n - m, self._n)
+        self._n -= m
+        self._shrink()
+
+    def pop(self, k=None):
+        """
+        Remove and return element at index k (default last).
+        """
+        if k is None:
+            k = self._n - 1
+        if not 0 <= k < self._n:
+            raise IndexError('invalid index')
+        answer = self._A[k]
+        self.delete_slice(k, k + 1)
+        return answer
+
     def remove(self, value):
         """
         Remove first occurrence of value (or raise ValueError).
         """
-        # note: we do not consider shrinking the dynamic array in this version
         for k in range(self._n):
             # found a match!
             if self._A[k] == value:
                 # shift others to fill gap
-                for j in range(k, self._n - 1):
-                    self._A[j] = self._A[j + 1]
-                # help garbage collection
-                self._A[self._n - 1] = None
-                # we have one less item
-                self._n -= 1
+                self.delete_slice(k, k + 1)
                 # exit immediately
                 return
         # only reached if no match
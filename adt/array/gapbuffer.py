@@ -0,0 +1,148 @@
+class GapBuffer:
+    """
+    A mutable sequence for insert-heavy editing, stored as a list with a gap.
+
+    Elements live in two runs, data[:gap_start] and data[gap_end:], with the
+    free slots (the gap) between them. An insert or delete at index k first
+    moves the gap to k, which moves |k - cursor| elements, where cursor is the
+    index the gap currently sits at; the edit itself is then O(1) amortized.
+    A run of edits close to each other therefore costs O(1) each, while a
+    single edit far away from the previous one costs as much as a shift in
+    DynamicArray.
+    """
+    DEFAULT_CAPACITY = 16  # moderate capacity for all new buffers
+
+    def __init__(self):
+        """
+        Create an empty buffer.
+        """
+        self._data = [None] * GapBuffer.DEFAULT_CAPACITY
+        # the gap is data[gap_start:gap_end]
+        self._gap_start = 0
+        self._gap_end = len(self._data)
+
+    def __len__(self):
+        """
+        Return number of elements stored in the buffer.
+        """
+        return len(self._data) - (self._gap_end - self._gap_start)
+
+    @property
+    def cursor(self):
+        """
+        Index at which the gap currently sits; edits here move no elements.
+        """
+        return self._gap_start
+
+    def __getitem__(self, k):
+        """
+        Return element at index k.
+        """
+        if not 0 <= k < len(self):
+            raise IndexError('invalid index')
+        if k >= self._gap_start:
+            # skip over the gap
+            k += self._gap_end - self._gap_start
+        return self._data[k]
+
+    def __setitem__(self, k, value):
+        """
+        Replace element at index k.
+        """
+        if not 0 <= k < len(self):
+            raise IndexError('invalid index')
+        if k >= self._gap_start:
+            k += self._gap_end - self._gap_start
+        self._data[k] = value
+
+    def __iter__(self):
+        """
+        Generate the elements from first to last.
+        """
+        for k in range(self._gap_start):
+            yield self._data[k]
+        for k in range(self._gap_end, len(self._data)):
+            yield self._data[k]
+
+    def _move_gap(self, k):
+        """
+        Move the gap so that it starts at index k.
+        """
+        start, end = self._gap_start, self._gap_end
+        if k < start:
+            # elements data[k:start] go to the far side of the gap
+            count = start - k
+            self._data[end - count:end] = self._data[k:start]
+            # help garbage collection in the slots that joined the gap
+            stale = min(start, end - count)
+            self._data[k:stale] = [None] * (stale - k)
+            self._gap_start, self._gap_end = k, end - count
+        elif k > start:
+            # elements just past the gap go to its near side
+            count = k - start
+            self._data[start:k] = self._data[end:end + count]
+            stale = max(end, k)
+            self._data[stale:end + count] = [None] * (end + count - stale)
+            self._gap_start, self._gap_end = k, end + count
+
+    def _resize(self, cap):  # we assume cap >= len(self)
+        """
+        Resize to a new list of capacity cap, keeping the gap where it is.
+        """
+        old = self._data
+        back = len(old) - self._gap_end
+        self._data = [None] * cap
+        self._data[:self._gap_start] = old[:self._gap_start]
+        self._data[cap - back:] = old[self._gap_end:]
+        self._gap_end = cap - back
+
+    def insert(self, k, value):
+        """
+        Insert value at index k, shifting subsequent values rightward.
+        """
+        if not 0 <= k <= len(self):
+            raise IndexError('invalid index')
+        # gap is exhausted
+        if self._gap_start == self._gap_end:
+            # so double capacity
+            self._resize(2 * len(self._data))
+        self._move_gap(k)
+        self._data[self._gap_start] = value
+        self._gap_start += 1
+
+    def append(self, value):
+        """
+        Add value to end of the buffer.
+        """
+        self.insert(len(self), value)
+
+    def pop(self, k=None):
+        """
+        Remove and return element at index k (default last).
+        """
+        if k is None:
+            k = len(self) - 1
+        if not 0 <= k < len(self):
+            raise IndexError('invalid index')
+        self._move_gap(k)
+        # element k now sits just after the gap
+        answer = self._data[self._gap_end]
+        # help garbage collection
+        self._data[self._gap_end] = None
+        self._gap_end += 1
+        # shrink once the buffer falls below a quarter full
+        if len(self._data) > GapBuffer.DEFAULT_CAPACITY and len(self) < len(self._data) // 4:
+            self._resize(len(self._data) // 2)
+        return answer
+
+    def remove(self, value):
+        """
+        Remove first occurrence of value (or raise ValueError).
+        """
+        for k, element in enumerate(self):
+            # found a match!
+            if element == value:
+                self.pop(k)
+                return
+        # only reached if no match
+        raise ValueError('value not found')
@@ -0,0 +1,180 @@
+import mmap
+import os
+import struct
+
+
+class MappedArray:
+    """
+    A file-backed dynamic array of fixed-width records, stored in an mmap'd file.
+
+    Records are tuples packed with a struct format string. The file starts with
+    a small header (magic, record count, format) followed by the packed records,
+    so reopening a file only reads the header, whatever the size of the data.
+    """
+    # magic, number of records, struct format padded with NUL bytes
+    _HEADER = struct.Struct('<8sQ48s')
+    _MAGIC = b'DYNARRAY'
+
+    def __init__(self, path, fmt=None):
+        """
+        Open the array stored at path, creating it if the file is missing or empty.
+        fmt is required to create a new array; when reopening it must match the stored one.
+        """
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        if not exists:
+            # check the format before creating the file, so a bad one leaves nothing behind
+            if fmt is None:
+                raise ValueError('a record format is needed to create a new array')
+            self._record = struct.Struct(fmt)
+            if self._record.size == 0:
+                raise ValueError('record format must have a nonzero size')
+            if len(self._record.format) > 48:
+                raise ValueError('record format too long')
+        self._file = open(path, 'r+b' if exists else 'w+b')
+        try:
+            if exists:
+                self._mm = mmap.mmap(self._file.fileno(), 0)
+                magic, n, stored = self._HEADER.unpack_from(self._mm, 0)
+                if magic != self._MAGIC:
+                    raise ValueError('not a MappedArray file: ' + repr(path))
+                stored = stored.rstrip(b'\0').decode('ascii')
+                if fmt is not None and struct.Struct(fmt).format != stored:
+                    raise ValueError('record format {0!r} does not match stored {1!r}'.format(fmt, stored))
+                self._record = struct.Struct(stored)
+                # count actual records
+                self._n = n
+            else:
+                self._n = 0
+                # default capacity of one record, as for DynamicArray
+                self._file.truncate(self._HEADER.size + self._record.size)
+                self._mm = mmap.mmap(self._file.fileno(), 0)
+                self._HEADER.pack_into(self._mm, 0, self._MAGIC, 0, self._record.format.encode('ascii'))
+        except Exception:
+            self._file.close()
+            raise
+        self._capacity = (len(self._mm) - self._HEADER.size) // self._record.size
+
+    def __len__(self):
+        """
+        Return number of records stored in the array.
+        """
+        return self._n
+
+    @property
+    def format(self):
+        """
+        The struct format string of one record.
+        """
+        return self._record.format
+
+    def _offset(self, k):
+        """
+        Return the file offset of record k.
+        """
+        return self._HEADER.size + k * self._record.size
+
+    def _set_count(self, n):
+        """
+        Record the number of records in the array and in the file header.
+        """
+        self._n = n
+        struct.pack_into('<Q', self._mm, 8, n)
+
+    def __getitem__(self, k):
+        """
+        Return the record (as a tuple) at index k.
+        """
+        if not 0 <= k < self._n:
+            raise IndexError('invalid index')
+        return self._record.unpack_from(self._mm, self._offset(k))
+
+    def __setitem__(self, k, record):
+        """
+        Overwrite the record at index k.
+        """
+        if not 0 <= k < self._n:
+            raise IndexError('invalid index')
+        self._record.pack_into(self._mm, self._offset(k), *record)
+
+    def __iter__(self):
+        """
+        Generate the records from first to last.
+        """
+        for k in range(self._n):
+            yield self._record.unpack_from(self._mm, self._offset(k))
+
+    def append(self, record):
+        """
+        Add a record to end of the array.
+        """
+        # not enough room
+        if self._n == self._capacity:
+            # so double capacity
+            self._resize(2 * self._capacity)
+        self._record.pack_into(self._mm, self._offset(self._n), *record)
+        self._set_count(self._n + 1)
+
+    def extend(self, records):
+        """
+        Add all records of an iterable to end of the array.
+        """
+        records = list(records)
+        if self._n + len(records) > self._capacity:
+            self._resize(max(2 * self._capacity, self._n + len(records)))
+        offset = self._offset(self._n)
+        for record in records:
+            self._record.pack_into(self._mm, offset, *record)
+            offset += self._record.size
+        self._set_count(self._n + len(records))
+
+    def pop(self):
+        """
+        Remove and return the last record.
+        """
+        if self._n == 0:
+            raise IndexError('pop from empty array')
+        answer = self[self._n - 1]
+        self._set_count(self._n - 1)
+        return answer
+
+    def view(self, start=0, stop=None):
+        """
+        Return a zero-copy memoryview of the bytes of records start to stop-1.
+        Release the view before the array next grows or is closed.
+        """
+        if stop is None:
+            stop = self._n
+        if not 0 <= start <= stop <= self._n:
+            raise IndexError('invalid slice')
+        return memoryview(self._mm)[self._offset(start):self._offset(stop)]
+
+    def _resize(self, c):
+        """
+        Resize the backing file to hold c records and remap it.
+        """
+        self._mm.flush()
+        self._mm.close()
+        self._file.truncate(self._offset(c))
+        self._mm = mmap.mmap(self._file.fileno(), 0)
+        self._capacity = c
+
+    def flush(self):
+        """
+        Write changes through to the backing file.
+        """
+        self._mm.flush()
+
+    def close(self):
+        """
+        Flush and release the mapping and the file.
+        """
+        if not self._file.closed:
+            self._mm.flush()
+            self._mm.close()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,299 @@
+_BITS = 5
+_WIDTH = 1 << _BITS  # branching factor of the trie
+_MASK = _WIDTH - 1
+
+
+class _Node:
+    """
+    Lightweight, nonpublic class for storing a trie node.
+    """
+    # streamline memory usage
+    __slots__ = '_edit', '_array'
+
+    def __init__(self, edit, array):
+        # owner token of the transient allowed to mutate this node in place
+        self._edit = edit
+        # child nodes, or elements for a leaf
+        self._array = array
+
+
+class _TrieBase:
+    """
+    Read-only behaviors shared by the persistent and transient vectors.
+    """
+
+    def __len__(self):
+        """
+        Return number of elements in the vector.
+        """
+        return self._cnt
+
+    def _tailoff(self):
+        """
+        Return index of the first element held in the tail.
+        """
+        if self._cnt < _WIDTH:
+            return 0
+        return ((self._cnt - 1) >> _BITS) << _BITS
+
+    def _leaf_for(self, i):
+        """
+        Return the leaf array holding element i.
+        """
+        if i >= self._tailoff():
+            return self._tail
+        node = self._root
+        level = self._shift
+        while level > 0:
+            node = node._array[(i >> level) & _MASK]
+            level -= _BITS
+        return node._array
+
+    def __getitem__(self, i):
+        """
+        Return element at index i.
+        """
+        if not 0 <= i < self._cnt:
+            raise IndexError('invalid index')
+        return self._leaf_for(i)[i & _MASK]
+
+
+class PersistentVector(_TrieBase):
+    """
+    An immutable vector stored as a 32-way bit-partitioned trie.
+
+    Updates return a new vector that shares all untouched nodes with the old
+    one, so append, set and __getitem__ cost O(log32 n) (effectively O(1)) and
+    a vector can be handed out as a snapshot without copying. The last (up to
+    32) elements are kept in a separate tail so most appends copy only the tail.
+    """
+
+    def __init__(self, iterable=()):
+        """
+        Create a vector holding the elements of iterable (empty by default).
+        """
+        self._set(0, _BITS, _Node(None, []), [])
+        t = self.transient()
+        t.extend(iterable)
+        v = t.persistent()
+        self._set(v._cnt, v._shift, v._root, v._tail)
+
+    def _set(self, cnt, shift, root, tail):
+        # number of elements
+        self._cnt = cnt
+        # bit offset of the root level
+        self._shift = shift
+        self._root = root
+        self._tail = tail
+
+    @classmethod
+    def _make(cls, cnt, shift, root, tail):
+        """
+        Return a vector built directly from its parts.
+        """
+        v = cls.__new__(cls)
+        v._set(cnt, shift, root, tail)
+        return v
+
+    def __iter__(self):
+        """
+        Generate the elements from first to last, one leaf at a time.
+        """
+        tailoff = self._tailoff()
+        for i in range(0, tailoff, _WIDTH):
+            yield from self._leaf_for(i)
+        yield from self._tail
+
+    def append(self, e):
+        """
+        Return a new vector with e added at the end.
+        """
+        cnt = self._cnt
+        # room in tail?
+        if cnt - self._tailoff() < _WIDTH:
+            return self._make(cnt + 1, self._shift, self._root, self._tail + [e])
+        # full tail, push it into the tree
+        tailnode = _Node(None, self._tail)
+        shift = self._shift
+        if (cnt >> _BITS) > (1 << shift):
+            # root overflow, grow the tree by one level
+            root = _Node(None, [self._root, _new_path(None, shift, tailnode)])
+            shift += _BITS
+        else:
+            root = self._push_tail(shift, self._root, tailnode)
+        return self._make(cnt + 1, shift, root, [e])
+
+    def _push_tail(self, level, parent, tailnode):
+        """
+        Return a copy of parent with tailnode added as its rightmost leaf.
+        """
+        subidx = ((self._cnt - 1) >> level) & _MASK
+        array = list(parent._array)
+        if level == _BITS:
+            child = tailnode
+        elif subidx < len(array):
+            child = self._push_tail(level - _BITS, array[subidx], tailnode)
+        else:
+            child = _new_path(None, level - _BITS, tailnode)
+        if subidx < len(array):
+            array[subidx] = child
+        else:
+            array.append(child)
+        return _Node(None, array)
+
+    def set(self, i, e):
+        """
+        Return a new vector with element i replaced by e.
+        """
+        if not 0 <= i < self._cnt:
+            raise IndexError('invalid index')
+        if i >= self._tailoff():
+            tail = list(self._tail)
+            tail[i & _MASK] = e
+            return self._make(self._cnt, self._shift, self._root, tail)
+        return self._make(self._cnt, self._shift, _assoc(self._shift, self._root, i, e), self._tail)
+
+    def transient(self):
+        """
+        Return a mutable TransientVector for batch updates of this vector.
+        """
+        return TransientVector(self)
+
+
+class TransientVector(_TrieBase):
+    """
+    A mutable view of a PersistentVector for fast bulk building.
+
+    Nodes created by the transient are updated in place; nodes shared with the
+    source vector are copied once, on first write. persistent() freezes the
+    result in O(1) and invalidates the transient.
+    """
+
+    def __init__(self, vector):
+        """
+        Constructor should not be invoked by user; use PersistentVector.transient().
+        """
+        # unique token identifying nodes this transient owns
+        self._edit = object()
+        self._cnt = vector._cnt
+        self._shift = vector._shift
+        self._root = _Node(self._edit, list(vector._root._array))
+        self._tail = list(vector._tail)
+
+    def _ensure_editable(self):
+        """
+        Raise TypeError if the transient has been frozen.
+        """
+        if self._edit is None:
+            raise TypeError('transient used after persistent() call')
+
+    def _editable(self, node):
+        """
+        Return node itself if owned by this transient, else an owned copy.
+        """
+        if node._edit is self._edit:
+            return node
+        return _Node(self._edit, list(node._array))
+
+    def __getitem__(self, i):
+        """
+        Return element at index i.
+        """
+        self._ensure_editable()
+        return super().__getitem__(i)
+
+    def append(self, e):
+        """
+        Add e at the end of the vector, in place.
+        """
+        self._ensure_editable()
+        cnt = self._cnt
+        if cnt - self._tailoff() < _WIDTH:
+            self._tail.append(e)
+            self._cnt += 1
+            return
+        tailnode = _Node(self._edit, self._tail)
+        if (cnt >> _BITS) > (1 << self._shift):
+            self._root = _Node(self._edit, [self._root, _new_path(self._edit, self._shift, tailnode)])
+            self._shift += _BITS
+        else:
+            self._root = self._push_tail(self._shift, self._root, tailnode)
+        self._tail = [e]
+        self._cnt += 1
+
+    def _push_tail(self, level, parent, tailnode):
+        """
+        Add tailnode as the rightmost leaf below parent, copying only shared nodes.
+        """
+        subidx = ((self._cnt - 1) >> level) & _MASK
+        node = self._editable(parent)
+        array = node._array
+        if level == _BITS:
+            child = tailnode
+        elif subidx < len(array):
+            child = self._push_tail(level - _BITS, array[subidx], tailnode)
+        else:
+            child = _new_path(self._edit, level - _BITS, tailnode)
+        if subidx < len(array):
+            array[subidx] = child
+        else:
+            array.append(child)
+        return node
+
+    def extend(self, iterable):
+        """
+        Append every element of iterable, in place.
+        """
+        for e in iterable:
+            self.append(e)
+
+    def set(self, i, e):
+        """
+        Replace element i by e, in place.
+        """
+        self._ensure_editable()
+        if not 0 <= i < self._cnt:
+            raise IndexError('invalid index')
+        if i >= self._tailoff():
+            self._tail[i & _MASK] = e
+            return
+        node = self._root = self._editable(self._root)
+        level = self._shift
+        while level > 0:
+            subidx = (i >> level) & _MASK
+            child = node._array[subidx] = self._editable(node._array[subidx])
+            node = child
+            level -= _BITS
+        node._array[i & _MASK] = e
+
+    def persistent(self):
+        """
+        Return the contents as a PersistentVector and invalidate this transient.
+        """
+        self._ensure_editable()
+        # no node may be changed in place from now on
+        self._edit = None
+        return PersistentVector._make(self._cnt, self._shift, self._root, self._tail)
+
+
+def _new_path(edit, level, node):
+    """
+    Return a chain of single-child nodes from level down to node.
+    """
+    while level > 0:
+        node = _Node(edit, [node])
+        level -= _BITS
+    return node
+
+
+def _assoc(level, node, i, e):
+    """
+    Return a copy of the path from node down to element i, with i set to e.
+    """
+    array = list(node._array)
+    if level == 0:
+        array[i & _MASK] = e
+    else:
+        subidx = (i >> level) & _MASK
+        array[subidx] = _assoc(level - _BITS, array[subidx], i, e)
+    return _Node(None, array)
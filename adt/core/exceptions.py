@@ -5,6 +5,13 @@ class Empty(Exception):
     pass
 
 
+class Full(Exception):
+    """
+    Error attempting to add an element to a full bounded container
+    """
+    pass
+
+
 class PrioQueueError(ValueError):
     pass
 
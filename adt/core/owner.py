@@ -0,0 +1,25 @@
+class Owner:
+    """
+    Lightweight marker naming the container an element belongs to.
+
+    Markers form a disjoint-set forest: when a container absorbs another,
+    the absorbed one's marker is linked under the survivor's, so none of
+    the moved elements has to be visited. An element belongs to the
+    container whose marker is the root of its own.
+    """
+    __slots__ = '_parent'
+
+    def __init__(self):
+        self._parent = None
+
+    def root(self):
+        """
+        Return the marker currently standing for this one, compressing the path.
+        """
+        root = self
+        while root._parent is not None:
+            root = root._parent
+        node = self
+        while node._parent is not None and node._parent is not root:
+            node._parent, node = root, node._parent
+        return root
@@ -1,4 +1,5 @@
-from .singlylinkedlist import LinkedList
+from .node import DoublyNodePool, SinglyNodePool
 from .poslist import PositionalList
+from .singlylinkedlist import LinkedList
 
-__all__ = ['LinkedList', 'PositionalList']
+__all__ = ['DoublyNodePool', 'LinkedList', 'PositionalList', 'SinglyNodePool']
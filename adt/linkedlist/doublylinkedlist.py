@@ -5,10 +5,12 @@ class _DoublyLinkedBase:
     """
     A base class providing a doubly linked list representation.
     """
-    def __init__(self):
+    def __init__(self, pool=None):
         """
         Create an empty list.
+        Nodes are recycled through pool (a DoublyNodePool) if one is given.
         """
+        self._pool = pool
         self._header = _Node(None, None, None)
         self._trailer = _Node(None, None, None)
         # trailer is after header
@@ -30,12 +32,20 @@ class _DoublyLinkedBase:
         """
         return self._size == 0
 
+    def _make_node(self, e, predecessor, successor):
+        """
+        Return a new node for element e, recycled from the pool if there is one.
+        """
+        if self._pool is None:
+            return _Node(e, predecessor, successor)
+        return self._pool.acquire(e, predecessor, successor)
+
     def _insert_between(self, e, predecessor, successor):
         """
         Add element e between two existing nodes and return new node.
         """
         # linked to neighbors
-        newest = _Node(e, predecessor, successor)
+        newest = self._make_node(e, predecessor, successor)
         predecessor._next = newest
         successor._prev = newest
         self._size += 1
@@ -54,4 +64,6 @@ class _DoublyLinkedBase:
         element = node._element
         # deprecate node
         node._prev = node._next = node._element = None
+        if self._pool is not None:
+            self._pool.release(node)
         return element
@@ -28,3 +28,102 @@ class _DoublyNode:
         self._prev = prev
         # reference to next node
         self._next = next
+
+
+class _PositionalNode(_DoublyNode):
+    """
+    Lightweight, nonpublic doubly linked node that also records the owner
+    marker of its positional list.
+    """
+    __slots__ = '_owner'
+
+    def __init__(self, element, prev, next, owner):
+        super().__init__(element, prev, next)
+        # marker of the list holding the node
+        self._owner = owner
+
+
+class _NodePool:
+    """
+    Bounded free list of discarded nodes, recycled by later inserts.
+
+    One pool may be shared by any number of containers. hits counts nodes
+    handed out from the free list, misses nodes that had to be allocated.
+    """
+
+    def __init__(self, maxsize=1024):
+        """
+        Create an empty pool that keeps at most maxsize free nodes.
+        """
+        self._free = []
+        self._maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        """
+        Return the number of free nodes in the pool.
+        """
+        return len(self._free)
+
+    def hit_rate(self):
+        """
+        Return the fraction of requests served from the free list.
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def release(self, node):
+        """
+        Return a node that no container references any more to the pool.
+        """
+        if len(self._free) < self._maxsize:
+            # drop references so the pool keeps nothing else alive
+            node._element = node._next = None
+            self._free.append(node)
+
+
+class SinglyNodePool(_NodePool):
+    """
+    Pool of singly linked nodes.
+    """
+
+    def acquire(self, element, next):
+        """
+        Return a node holding element and next, recycled if possible.
+        """
+        if self._free:
+            self.hits += 1
+            node = self._free.pop()
+            node._element = element
+            node._next = next
+            return node
+        self.misses += 1
+        return _SinglyNode(element, next)
+
+
+class DoublyNodePool(_NodePool):
+    """
+    Pool of doubly linked nodes.
+    """
+
+    def release(self, node):
+        """
+        Return a node that no container references any more to the pool.
+        """
+        node._prev = None
+        super().release(node)
+
+    def acquire(self, element, prev, next):
+        """
+        Return a node holding element, prev and next, recycled if possible.
+        """
+        if self._free:
+            self.hits += 1
+            node = self._free.pop()
+            node._element = element
+            node._prev = prev
+            node._next = next
+            return node
+        self.misses += 1
+        return _DoublyNode(element, prev, next)
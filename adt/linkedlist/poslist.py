@@ -1,9 +1,21 @@
+from core.owner import Owner
 from .doublylinkedlist import _DoublyLinkedBase
+from .node import _PositionalNode
 
 
 class PositionalList(_DoublyLinkedBase):
     """
     A sequential container of elements allowing positional access.
+
+    A Position is tied to its node, and each node to an owner marker, so a
+    Position follows its element when splice, split_at or extend_from move
+    the node to another list, and stays rejected by every other list.
+    extend_from and move_to_front take O(1) time; splice relabels the k
+    moved nodes in O(k) and split_at the shorter side in O(min(k, n - k)),
+    without allocating nodes.
+
+    A Position may outlive its node, and a recycled node would make a stale
+    Position look valid again, so the list takes no node pool.
     """
 
     class Position:
@@ -11,11 +23,10 @@ class PositionalList(_DoublyLinkedBase):
         An abstraction representing the location of a single element.
         """
 
-        def __init__(self, container, node):
+        def __init__(self, node):
             """
             Constructor should not be invoked by user.
             """
-            self._container = container
             self._node = node
 
         def element(self):
@@ -42,11 +53,11 @@ class PositionalList(_DoublyLinkedBase):
         """
         if not isinstance(p, self.Position):
             raise TypeError('p must be proper Position type')
-        if p._container is not self:
-            raise ValueError('p does not belong to this container')
         # convention for deprecated nodes
         if p._node._next is None:
             raise ValueError('p is no longer valid')
+        if p._node._owner.root() is not self._owner:
+            raise ValueError('p does not belong to this container')
         return p._node
 
     def _make_position(self, node):
@@ -58,7 +69,21 @@ class PositionalList(_DoublyLinkedBase):
             return None
         else:
             # legitimate position
-            return self.Position(self, node)
+            return self.Position(node)
+
+    def __init__(self):
+        """
+        Create an empty list.
+        """
+        super().__init__()
+        # marker of the nodes of this list, always a root
+        self._owner = Owner()
+
+    def _make_node(self, e, predecessor, successor):
+        """
+        Return a new node for element e, owned by this list.
+        """
+        return _PositionalNode(e, predecessor, successor, self._owner)
 
     # accessors
     def first(self):
@@ -151,3 +176,117 @@ class PositionalList(_DoublyLinkedBase):
         original._element = e
         # return the old element value
         return old_value
+
+    # bulk moves: relink runs of nodes without allocating or copying them
+    @staticmethod
+    def _unlink(first, last):
+        """
+        Detach the run of nodes from first to last from its list.
+        """
+        first._prev._next = last._next
+        last._next._prev = first._prev
+
+    @staticmethod
+    def _link(first, last, predecessor, successor):
+        """
+        Attach the run of nodes from first to last between two adjacent nodes.
+        """
+        first._prev = predecessor
+        last._next = successor
+        predecessor._next = first
+        successor._prev = last
+
+    @staticmethod
+    def _relabel(first, stop, owner):
+        """
+        Mark the nodes from first up to (not including) stop as owned by owner.
+        """
+        walk = first
+        while walk is not stop:
+            walk._owner = owner
+            walk = walk._next
+
+    def splice(self, p_start, p_end, other, after=None):
+        """
+        Move the elements from Position p_start through Position p_end of this
+        list into list other, just after Position after (at the front if None).
+        Positions of the moved elements stay valid, now in other.
+        """
+        first = self._validate(p_start)
+        last = self._validate(p_end)
+        predecessor = other._header if after is None else other._validate(after)
+        # count the run, checking it is one and does not hold the destination
+        count = 1
+        walk = first
+        while walk is not last:
+            if walk is predecessor:
+                raise ValueError('after lies inside the moved run')
+            walk = walk._next
+            if walk is self._trailer:
+                raise ValueError('p_start comes after p_end')
+            count += 1
+        if predecessor is last or predecessor is first._prev:
+            # already in place
+            return
+        self._unlink(first, last)
+        self._link(first, last, predecessor, predecessor._next)
+        if other is not self:
+            self._relabel(first, last._next, other._owner)
+            self._size -= count
+            other._size += count
+
+    def split_at(self, p):
+        """
+        Remove the elements from Position p to the end of this list and
+        return them as a new list. Their positions stay valid, now in it.
+        """
+        first = self._validate(p)
+        # walk both ways from p until one end is reached: the shorter side gets relabelled
+        ahead, behind = first, first._prev
+        steps = 0
+        while ahead is not self._trailer and behind is not self._header:
+            ahead = ahead._next
+            behind = behind._prev
+            steps += 1
+        tail = type(self)()
+        if ahead is self._trailer:
+            # the moved run is the shorter side
+            moved = steps
+            self._relabel(first, self._trailer, tail._owner)
+        else:
+            # the kept front is: the new list takes over this list's marker
+            moved = self._size - steps
+            self._owner, tail._owner = tail._owner, self._owner
+            self._relabel(self._header._next, first, self._owner)
+        last = self._trailer._prev
+        self._unlink(first, last)
+        self._link(first, last, tail._header, tail._trailer)
+        self._size -= moved
+        tail._size = moved
+        return tail
+
+    def extend_from(self, other):
+        """
+        Move all elements of list other to the end of this list, leaving other empty.
+        Their positions stay valid, now in this list.
+        """
+        if other is self or other.is_empty():
+            return
+        first = other._header._next
+        last = other._trailer._prev
+        self._unlink(first, last)
+        self._link(first, last, self._trailer._prev, self._trailer)
+        # other's nodes now answer to this list's marker; other starts afresh
+        other._owner._parent = self._owner
+        other._owner = Owner()
+        self._size += other._size
+        other._size = 0
+
+    def move_to_front(self, p):
+        """
+        Move the element at Position p to the front of the list; p stays valid.
+        """
+        node = self._validate(p)
+        if node._prev is not self._header:
+            self._unlink(node, node)
+            self._link(node, node, self._header, self._header._next)
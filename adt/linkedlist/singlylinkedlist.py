@@ -3,14 +3,19 @@ from .node import _SinglyNode as _Node
 
 
 class LinkedList:
+    """
+    Singly linked list keeping references to both its head and its tail node.
+    """
 
     def __init__(self):
         """
         Create an empty list.
         """
         # reference to the head node
-        self._head = _Node(None, None)
-        # number of stack elements
+        self._head = None
+        # reference to the tail node
+        self._tail = None
+        # number of list elements
         self._size = 0
 
     def __len__(self):
@@ -25,16 +30,24 @@ class LinkedList:
         """
         return self._size == 0
 
+    def __iter__(self):
+        """
+        Generate the elements from head to tail.
+        """
+        node = self._head
+        while node is not None:
+            yield node._element
+            node = node._next
+
     def add_first(self, e):
         """
         Add element e at the beginning.
         """
-        newest = _Node(e, None)
+        newest = _Node(e, self._head)
         if self.is_empty():
-            self._head = newest
-        else:
-            newest._next = self._head
-            self._head = newest
+            # special case: previously empty
+            self._tail = newest
+        self._head = newest
         self._size += 1
         return newest
 
@@ -44,16 +57,22 @@ class LinkedList:
         """
         newest = _Node(e, None)
         if self.is_empty():
+            # special case: previously empty
             self._head = newest
-            self._size += 1
         else:
-            cur = self._head
-            while cur._next is not None:
-                cur = cur._next
-            cur._next = newest
-            self._size += 1
+            self._tail._next = newest
+        # update reference to tail node
+        self._tail = newest
+        self._size += 1
         return newest
 
+    def extend(self, iterable):
+        """
+        Insert the elements of iterable at the end, in order.
+        """
+        for e in iterable:
+            self.add_last(e)
+
     def remove_first(self):
         """
         remove the node at the beginning.
@@ -62,34 +81,49 @@ class LinkedList:
             raise Empty('LinkedList is empty')
 
         node = self._head
-        self._head = self._head._next
+        self._head = node._next
+        self._size -= 1
+        if self.is_empty():
+            # removed head had been the tail
+            self._tail = None
+        return node._element
+
+    def _before(self, node):
+        """
+        Return the node just before node (None if node is the head).
+        """
+        if node is self._head:
+            return None
+        prev = self._head
+        while prev._next is not node:
+            prev = prev._next
+        return prev
+
+    def _unlink(self, prev, node):
+        """
+        Remove node, which follows prev (None if node is the head), and return its element.
+        """
+        if prev is None:
+            self._head = node._next
+        else:
+            prev._next = node._next
+        if node is self._tail:
+            self._tail = prev
         self._size -= 1
         element = node._element
-        node = None
+        # deprecate node
+        node._next = node._element = None
         return element
 
     def remove_last(self):
         """
         remove the node at the end.
+        Without backward links the node before the tail must be found by a walk, so this is O(n).
         """
         if self.is_empty():
             raise Empty('LinkedList is empty')
 
-        node = self._head
-        if self._size == 1:
-            self._head = _Node(None, None)
-            self._size -= 1
-            return node._element
-
-        while node._next is not None:
-            node = node._next
-            if node._next is None:
-                tail = node._next
-                self._size -= 1
-        node._next = None
-        element = tail._element
-        element = None
-        return element
+        return self._unlink(self._before(self._tail), self._tail)
 
     def search(self, e):
         """
@@ -101,22 +135,87 @@ class LinkedList:
         return node
 
     def remove_node(self, node):
+        """
+        Remove node from the list and return its element.
+        """
         if self.is_empty():
             raise Empty('LinkedList is empty')
 
-        if self._size == 1:
-            self._head = _Node(None, None)
-            self._size -= 1
-        else:
-            if node._next is None:
-                self.remove_last()
-            else:
-                nxt = node._next
-                node._element = nxt._element
-                node._next = nxt._next
-                nxt = None
-                self._size -= 1
-        return node._element
+        if node._next is None:
+            # the tail needs its predecessor
+            return self._unlink(self._before(node), node)
+        # copy the successor into node and remove the successor instead, in O(1)
+        element = node._element
+        nxt = node._next
+        node._element = nxt._element
+        self._unlink(node, nxt)
+        return element
 
     def remove_element(self, e):
-        pass
+        """
+        Remove the first occurrence of element e (or raise ValueError).
+        """
+        prev = None
+        node = self._head
+        while node is not None:
+            if node._element == e:
+                return self._unlink(prev, node)
+            prev = node
+            node = node._next
+        raise ValueError('element not found')
+
+    def concat(self, other):
+        """
+        Move all elements of other to the end of this list in O(1), leaving other empty.
+        """
+        if other is self or other.is_empty():
+            return
+        if self.is_empty():
+            self._head = other._head
+        else:
+            self._tail._next = other._head
+        self._tail = other._tail
+        self._size += other._size
+        other._head = other._tail = None
+        other._size = 0
+
+    def reverse(self):
+        """
+        Reverse the order of the elements in place.
+        """
+        prev = None
+        node = self._head
+        while node is not None:
+            nxt = node._next
+            node._next = prev
+            prev = node
+            node = nxt
+        self._head, self._tail = self._tail, self._head
+
+    def merge_sorted(self, other):
+        """
+        Merge the sorted list other into this sorted list, leaving other empty.
+        Nodes are relinked rather than copied; on equal elements, those of this list come first.
+        """
+        if other is self or other.is_empty():
+            return
+        # dummy head collects the merged chain
+        merged = tail = _Node(None, None)
+        a = self._head
+        b = other._head
+        while a is not None and b is not None:
+            if b._element < a._element:
+                tail._next = b
+                b = b._next
+            else:
+                tail._next = a
+                a = a._next
+            tail = tail._next
+        tail._next = a if a is not None else b
+        self._head = merged._next
+        if a is None:
+            # the rest of other ends the merged list
+            self._tail = other._tail
+        self._size += other._size
+        other._head = other._tail = None
+        other._size = 0
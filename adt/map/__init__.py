@@ -2,9 +2,10 @@ from .chainhashmap import ChainHashMap
 from .multimap import MultiMap
 from .probehashmap import ProbeHashMap
 from .shashtable import SortedTableMap
+from .skiplist import SkipListMap
 from .hashtable import UnsortedTableMap
 
-__all__ = ['ChainHashMap', 'MultiMap', 'ProbeHashMap', 'SortedTableMap', 'UnsortedTableMap']
+__all__ = ['ChainHashMap', 'MultiMap', 'ProbeHashMap', 'SkipListMap', 'SortedTableMap', 'UnsortedTableMap']
 
 
 def hash_code(s):
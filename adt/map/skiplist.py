@@ -0,0 +1,285 @@
+import random
+
+from .map import MapBase
+
+
+class SkipListMap(MapBase):
+    """
+    Sorted map implementation using an indexable skip list.
+
+    Every node appears in level 0 and, with probability 1/2 for each further
+    level, in the levels above; searches run right along the top level and
+    drop down, in O(log n) expected time. Each link also records how many
+    level-0 steps it spans, which gives rank and select in O(log n).
+
+    The predecessors found by the last search are kept as a finger: a search
+    for a larger key climbs from the finger only as high as needed, so runs of
+    nearby (ascending) keys cost O(log d) each, for a distance d between them.
+    """
+    MAX_LEVEL = 32  # enough for 2**32 items
+
+    class _Node(MapBase._Item):
+        """
+        Lightweight, nonpublic class for storing a skip list node.
+        """
+        __slots__ = '_next', '_width'
+
+        def __init__(self, k, v, level):
+            super().__init__(k, v)
+            # following node at each level
+            self._next = [None] * level
+            # number of level-0 steps spanned by each forward link
+            self._width = [1] * level
+
+    # nonpublic behaviors
+    def _random_level(self):
+        """
+        Return a level drawn from a geometric distribution with p = 1/2.
+        """
+        # the lowest set bit of a random word; the top bit bounds the level
+        bits = random.getrandbits(self.MAX_LEVEL - 1) | (1 << (self.MAX_LEVEL - 1))
+        return (bits & -bits).bit_length()
+
+    def _find(self, k):
+        """
+        Return (update, rank): for each level in use, the last node with key < k
+        and its rank (head is 0, first item 1). The result becomes the new finger.
+        """
+        update = self._finger
+        rank = self._finger_rank
+        level = self._level
+        f = update[0]
+        if f is self._head or not f._key < k:
+            # finger is of no help: search from the top of head
+            update = [self._head] * level
+            rank = [0] * level
+            top = level - 1
+        else:
+            update = list(update)
+            rank = list(rank)
+            # climb while the finger's successor at this level is still < k
+            top = 0
+            while top < level:
+                nxt = update[top]._next[top]
+                if nxt is None or not nxt._key < k:
+                    break
+                top += 1
+            if top == level:
+                top = level - 1
+            else:
+                # levels top and above are already right
+                top -= 1
+        node = update[max(top, 0)]
+        pos = rank[max(top, 0)]
+        for j in range(top, -1, -1):
+            if rank[j] > pos:
+                # the finger is further right at this lower level
+                node = update[j]
+                pos = rank[j]
+            nxt = node._next[j]
+            while nxt is not None and nxt._key < k:
+                pos += node._width[j]
+                node = nxt
+                nxt = node._next[j]
+            update[j] = node
+            rank[j] = pos
+        self._finger = update
+        self._finger_rank = rank
+        return update, rank
+
+    def _find_node(self, k):
+        """
+        Return the node with key k (or None if not found).
+        """
+        update, _ = self._find(k)
+        node = update[0]._next[0]
+        if node is not None and node._key == k:
+            return node
+        return None
+
+    # public behaviors
+    def __init__(self):
+        """
+        Create an empty map.
+        """
+        self._head = self._Node(None, None, self.MAX_LEVEL)
+        # number of levels in use
+        self._level = 1
+        self._size = 0
+        # predecessors (and their ranks) found by the last search
+        self._finger = [self._head]
+        self._finger_rank = [0]
+
+    def __len__(self):
+        """
+        Return number of items in the map.
+        """
+        return self._size
+
+    def __getitem__(self, k):
+        """
+        Return value associated with key k (raise KeyError if not found).
+        """
+        node = self._find_node(k)
+        if node is None:
+            raise KeyError('Key Error: ' + repr(k))
+        return node._value
+
+    def __setitem__(self, k, v):
+        """
+        Assign value v to key k, overwriting existing value if present.
+        """
+        update, rank = self._find(k)
+        nxt = update[0]._next[0]
+        if nxt is not None and nxt._key == k:
+            # reassign value
+            nxt._value = v
+            return
+        level = self._random_level()
+        if level > self._level:
+            for j in range(self._level, level):
+                # the head's unused links span the whole list
+                self._head._next[j] = None
+                self._head._width[j] = self._size + 1
+                update.append(self._head)
+                rank.append(0)
+            self._level = level
+        node = self._Node(k, v, level)
+        r = rank[0] + 1  # rank of the new node
+        for j in range(level):
+            pred = update[j]
+            # the old successor moves from rank[j] + width to one past it
+            node._width[j] = rank[j] + pred._width[j] + 1 - r
+            pred._width[j] = r - rank[j]
+            node._next[j] = pred._next[j]
+            pred._next[j] = node
+        for j in range(level, self._level):
+            # links passing over the new node get one step longer
+            update[j]._width[j] += 1
+        self._size += 1
+
+    def __delitem__(self, k):
+        """
+        Remove item associated with key k (raise KeyError if not found).
+        """
+        update, rank = self._find(k)
+        node = update[0]._next[0]
+        if node is None or node._key != k:
+            raise KeyError('Key Error: ' + repr(k))
+        for j in range(self._level):
+            pred = update[j]
+            if pred._next[j] is node:
+                pred._width[j] += node._width[j] - 1
+                pred._next[j] = node._next[j]
+            else:
+                pred._width[j] -= 1
+        # drop levels left empty
+        while self._level > 1 and self._head._next[self._level - 1] is None:
+            self._level -= 1
+            update.pop()
+            rank.pop()
+        self._size -= 1
+
+    def __iter__(self):
+        """
+        Generate keys of the map ordered from minimum to maximum.
+        """
+        node = self._head._next[0]
+        while node is not None:
+            yield node._key
+            node = node._next[0]
+
+    def __reversed__(self):
+        """
+        Generate keys of the map ordered from maximum to minimum.
+        """
+        # there are no backward links to follow
+        yield from reversed(list(self))
+
+    def find_min(self):
+        """
+        Return (key, value) pair with minimum key (or None if empty).
+        """
+        node = self._head._next[0]
+        if node is None:
+            return None
+        return (node._key, node._value)
+
+    def find_max(self):
+        """
+        Return (key, value) pair with maximum key (or None if empty).
+        """
+        node = self._head
+        for j in range(self._level - 1, -1, -1):
+            while node._next[j] is not None:
+                node = node._next[j]
+        if node is self._head:
+            return None
+        return (node._key, node._value)
+
+    def find_ge(self, k):
+        """
+        Return (key, value) pair with least key greater than or equal to k.
+        """
+        update, _ = self._find(k)
+        node = update[0]._next[0]
+        if node is None:
+            return None
+        return (node._key, node._value)
+
+    def find_lt(self, k):
+        """
+        Return (key, value) pair with greatest key strictly less than k.
+        """
+        update, _ = self._find(k)
+        node = update[0]
+        if node is self._head:
+            return None
+        return (node._key, node._value)
+
+    def find_gt(self, k):
+        """
+        Return (key, value) pair with least key strictly greater than k.
+        """
+        update, _ = self._find(k)
+        node = update[0]._next[0]
+        if node is not None and node._key == k:
+            # advanced past match
+            node = node._next[0]
+        if node is None:
+            return None
+        return (node._key, node._value)
+
+    def find_range(self, start, stop):
+        """
+        Iterate all (key, value) pairs such that start <= key < stop.
+        If start is None, iteration begins with minimum key of map.
+        If stop is None, iteration continues through the maximum key of map.
+        """
+        if start is None:
+            node = self._head._next[0]
+        else:
+            node = self._find(start)[0][0]._next[0]
+        while node is not None and (stop is None or node._key < stop):
+            yield (node._key, node._value)
+            node = node._next[0]
+
+    def rank(self, k):
+        """
+        Return the number of keys strictly less than k.
+        """
+        return self._find(k)[1][0]
+
+    def select(self, i):
+        """
+        Return (key, value) pair with the i-th smallest key, counting from 0.
+        """
+        if not 0 <= i < self._size:
+            raise IndexError('invalid index')
+        node = self._head
+        pos = 0
+        for j in range(self._level - 1, -1, -1):
+            while node._next[j] is not None and pos + node._width[j] <= i + 1:
+                pos += node._width[j]
+                node = node._next[j]
+        return (node._key, node._value)
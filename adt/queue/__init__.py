@@ -1,12 +1,31 @@
 from .adaheapq import AdaptableHeapPriorityQueue
-from .arrayque import ArrayQueue
+from .arrayque import ArrayQueue, MaskedArrayQueue
+from .arrdeque import ArrayDeque
 from .arrprioque import PrioQue
+from .asyncprioque import AsyncPriorityQueue
+from .asyncque import AsyncArrayQueue, AsyncCircularQueue, AsyncLinkedQueue, AsyncQueue
+from .blockprioque import BlockingPriorityQueue
+from .blockque import BlockingQueue
+from .calendarq import CalendarQueue
 from .cirqueue import CircularQueue
+from .daryheapq import DaryHeapPriorityQueue
 from .deque import LinkedDeque
 from .heapq import HeapPriorityQueue
+from .heapstream import bottom_k, merge_sorted, top_k
+from .indexprioque import IndexedPriorityQueue
 from .linkedque import LinkedQueue
+from .minmaxheapq import MinMaxHeapPriorityQueue
+from .pairheapq import PairingHeapPriorityQueue
+from .radixheapq import RadixHeapPriorityQueue
+from .shmring import SharedRingBuffer
 from .sproique import SortedPriorityQueue
+from .timingwheel import TimingWheel
+from .unrolleddeque import UnrolledDeque
 from .unsproique import UnsortedPriorityQueue
 
-__all__ = ['AdaptableHeapPriorityQueue', 'ArrayQueue', 'PrioQue', 'CircularQueue', 'LinkedDeque', 'HeapPriorityQueue',
-           'LinkedQueue', 'SortedPriorityQueue', 'UnsortedPriorityQueue']
+__all__ = ['AdaptableHeapPriorityQueue', 'ArrayQueue', 'ArrayDeque', 'AsyncArrayQueue', 'AsyncCircularQueue',
+           'AsyncLinkedQueue', 'AsyncQueue', 'BlockingQueue', 'PrioQue', 'CircularQueue', 'LinkedDeque',
+           'HeapPriorityQueue', 'LinkedQueue', 'MaskedArrayQueue', 'SharedRingBuffer', 'SortedPriorityQueue',
+           'UnrolledDeque', 'UnsortedPriorityQueue', 'DaryHeapPriorityQueue', 'PairingHeapPriorityQueue',
+           'IndexedPriorityQueue', 'RadixHeapPriorityQueue', 'TimingWheel', 'CalendarQueue', 'AsyncPriorityQueue',
+           'BlockingPriorityQueue', 'MinMaxHeapPriorityQueue', 'bottom_k', 'merge_sorted', 'top_k']
@@ -1,3 +1,4 @@
+from core.exceptions import Empty
 from .heapq import HeapPriorityQueue
 
 
@@ -25,6 +26,31 @@ class AdaptableHeapPriorityQueue(HeapPriorityQueue):
         self._data[i]._index = i
         self._data[j]._index = j
 
+    # override sifts to record the new indices along the path moved
+    def _unheap(self, j):
+        end = super()._unheap(j)
+        while True:
+            self._data[j]._index = j
+            if j == end:
+                break
+            j = self._parent(j)
+        return end
+
+    def _downheap(self, j):
+        end = super()._downheap(j)
+        i = end
+        while True:
+            self._data[i]._index = i
+            if i == j:
+                break
+            i = self._parent(i)
+        return end
+
+    def _heapify(self):
+        super()._heapify()
+        for j, loc in enumerate(self._data):
+            loc._index = j
+
     def _bubble(self, j):
         if j > 0 and self._data[j] < self._data[self._parent(j)]:
             self._unheap(j)
@@ -41,6 +67,53 @@ class AdaptableHeapPriorityQueue(HeapPriorityQueue):
         self._unheap(len(self._data) - 1)
         return token
 
+    # bulk and combined operations also hand out the locators of new entries
+    @classmethod
+    def from_items(cls, iterable):
+        """
+        Create a priority queue holding the (key, value) pairs of iterable, in O(n) time.
+        Return the queue and the list of locators of the pairs, in input order.
+        """
+        pq = cls()
+        locators = [pq.Locator(k, v, j) for j, (k, v) in enumerate(iterable)]
+        pq._data = list(locators)
+        pq._heapify()
+        return pq, locators
+
+    def pushpop(self, key, value):
+        """
+        Add a key-value pair, then remove and return (k, v) tuple with minimum key.
+        Return it with the locator of the new entry (None if the new pair itself is removed).
+        """
+        if not self._data or not self._data[0]._key < key:
+            return (key, value), None
+        return self.replace(key, value)
+
+    def replace(self, key, value):
+        """
+        Remove (k, v) tuple with minimum key, then add a key-value pair.
+        Return the removed tuple with the locator of the new entry.
+        Raise Empty exception if empty.
+        """
+        if self.is_empty():
+            raise Empty('Priority queue is empty.')
+        item = self._data[0]
+        token = self.Locator(key, value, 0)
+        self._data[0] = token
+        # the overridden sift records the new indices along its path
+        self._downheap(0)
+        return (item._key, item._value), token
+
+    def merge(self, other):
+        """
+        Move all entries of the adaptable heap priority queue other into this one,
+        leaving other empty. Their locators stay valid, now for this queue.
+        Raise TypeError if other is not an adaptable heap priority queue.
+        """
+        if not isinstance(other, AdaptableHeapPriorityQueue):
+            raise TypeError('other must be an adaptable heap priority queue')
+        super().merge(other)
+
     def update(self, loc, newkey, newval):
         """
         Update the key and value for the entry identified by Locator loc.
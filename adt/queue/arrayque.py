@@ -11,7 +11,7 @@ class ArrayQueue:
         """
         Create an empty queue.
         """
-        self._data = [None] * ArrayQueue.DEFAULT_CAPACITY
+        self._data = [None] * self.DEFAULT_CAPACITY
         self._size = 0
         self._front = 0
 
@@ -49,6 +49,9 @@ class ArrayQueue:
         self._data[self._front] = None  # help garbage collection
         self._front = (self._front + 1) % len(self._data)
         self._size -= 1
+        # shrink once below a quarter full
+        if len(self._data) > self.DEFAULT_CAPACITY and self._size < len(self._data) >> 2:
+            self._resize(len(self._data) // 2)
         return answer
 
     def enqueue(self, e):
@@ -61,14 +64,106 @@ class ArrayQueue:
         self._data[avail] = e
         self._size += 1
 
+    def enqueue_many(self, iterable):
+        """
+        Add all elements of iterable to the back of queue, in order.
+        """
+        values = list(iterable)
+        m = len(values)
+        if self._size + m > len(self._data):
+            self._resize(max(2 * len(self._data), self._size + m))
+        cap = len(self._data)
+        avail = (self._front + self._size) % cap
+        # free slots run from avail to the end, then wrap to the start
+        head = min(m, cap - avail)
+        self._data[avail:avail + head] = values[:head]
+        self._data[:m - head] = values[head:]
+        self._size += m
+
+    def dequeue_many(self, n):
+        """
+        Remove and return a list of the first min(n, len(self)) elements of the queue.
+        Raise ValueError if n is negative.
+        """
+        if n < 0:
+            raise ValueError('n must be non-negative')
+        n = min(n, self._size)
+        cap = len(self._data)
+        # elements run from front to the end, then wrap to the start
+        head = min(n, cap - self._front)
+        answer = self._data[self._front:self._front + head]
+        answer += self._data[:n - head]
+        # help garbage collection
+        self._data[self._front:self._front + head] = [None] * head
+        self._data[:n - head] = [None] * (n - head)
+        self._front = (self._front + n) % cap
+        self._size -= n
+        self._shrink()
+        return answer
+
+    def _shrink(self):
+        """
+        Halve the capacity once the queue falls below a quarter full.
+        """
+        if len(self._data) > self.DEFAULT_CAPACITY and self._size < len(self._data) // 4:
+            self._resize(len(self._data) // 2)
+
     def _resize(self, cap):  # we assume cap >= len(self)
         """
         Resize to a new list of capacity >= len(self).
         """
         old = self._data  # keep track of existing list
         self._data = [None] * cap  # allocate list with new capacity
-        walk = self._front
-        for k in range(self._size):  # only consider existing elements
-            self._data[k] = old[walk]  # intentionally shift indices
-            walk = (1 + walk) % len(old)  # use old size as modulus
+        # existing elements form at most two runs of old
+        head = min(self._size, len(old) - self._front)
+        self._data[:head] = old[self._front:self._front + head]  # intentionally shift indices
+        self._data[head:self._size] = old[:self._size - head]
         self._front = 0  # front has been realigned
+
+
+class MaskedArrayQueue(ArrayQueue):
+    """
+    FIFO queue on a circular list whose capacity is always a power of two,
+    so wrapping an index is a bit mask instead of a modulo.
+    """
+    DEFAULT_CAPACITY = 16  # must be a power of two
+
+    def __init__(self):
+        """
+        Create an empty queue.
+        """
+        super().__init__()
+        self._mask = len(self._data) - 1
+
+    def dequeue(self):
+        """
+        Remove and return the first element of the queue (i.e., FIFO).
+        Raise Empty exception if the queue is empty.
+        """
+        if self._size == 0:
+            raise Empty('Queue is empty')
+
+        answer = self._data[self._front]
+        self._data[self._front] = None  # help garbage collection
+        self._front = (self._front + 1) & self._mask
+        self._size -= 1
+        # shrink once below a quarter full
+        if self._mask >= self.DEFAULT_CAPACITY and self._size < (self._mask + 1) >> 2:
+            self._resize(len(self._data) // 2)
+        return answer
+
+    def enqueue(self, e):
+        """
+        Add an element to the back of queue.
+        """
+        if self._size > self._mask:
+            self._resize(2 * len(self._data))  # double the array size
+        self._data[(self._front + self._size) & self._mask] = e
+        self._size += 1
+
+    def _resize(self, cap):  # we assume cap >= len(self)
+        """
+        Resize to a list whose capacity is the least power of two >= cap.
+        """
+        super()._resize(1 << (cap - 1).bit_length())
+        self._mask = len(self._data) - 1
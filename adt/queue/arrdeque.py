@@ -0,0 +1,197 @@
+from core.exceptions import Empty
+
+
+class ArrayDeque:
+    """
+    Double-ended queue implementation using a Python list as a circular array.
+    """
+    DEFAULT_CAPACITY = 10  # moderate capacity for all new deques
+
+    def __init__(self):
+        """
+        Create an empty deque.
+        """
+        self._data = [None] * ArrayDeque.DEFAULT_CAPACITY
+        self._size = 0
+        self._front = 0
+
+    def __len__(self):
+        """
+        Return the number of elements in the deque.
+        """
+        return self._size
+
+    def is_empty(self):
+        """
+        Return True if the deque is empty.
+        """
+        return self._size == 0
+
+    def _index(self, k):
+        """
+        Return the list index of the element at position k of the deque.
+        """
+        return (self._front + k) % len(self._data)
+
+    def __getitem__(self, k):
+        """
+        Return the element at position k (0 is the front).
+        """
+        if not 0 <= k < self._size:
+            raise IndexError('invalid index')
+        return self._data[self._index(k)]
+
+    def __setitem__(self, k, e):
+        """
+        Replace the element at position k (0 is the front).
+        """
+        if not 0 <= k < self._size:
+            raise IndexError('invalid index')
+        self._data[self._index(k)] = e
+
+    def __iter__(self):
+        """
+        Generate the elements from front to back.
+        """
+        for k in range(self._size):
+            yield self._data[self._index(k)]
+
+    def first(self):
+        """
+        Return (but do not remove) the element at the front of the deque.
+        Raise Empty exception if the deque is empty.
+        """
+        if self.is_empty():
+            raise Empty('Deque is empty')
+        return self._data[self._front]
+
+    def last(self):
+        """
+        Return (but do not remove) the element at the back of the deque.
+        Raise Empty exception if the deque is empty.
+        """
+        if self.is_empty():
+            raise Empty('Deque is empty')
+        return self._data[self._index(self._size - 1)]
+
+    def insert_first(self, e):
+        """
+        Add an element to the front of the deque.
+        """
+        if self._size == len(self._data):
+            self._resize(2 * len(self._data))  # double the array size
+        self._front = (self._front - 1) % len(self._data)
+        self._data[self._front] = e
+        self._size += 1
+
+    def insert_last(self, e):
+        """
+        Add an element to the back of the deque.
+        """
+        if self._size == len(self._data):
+            self._resize(2 * len(self._data))  # double the array size
+        self._data[self._index(self._size)] = e
+        self._size += 1
+
+    def delete_first(self):
+        """
+        Remove and return the element from the front of the deque.
+        Raise Empty exception if the deque is empty.
+        """
+        if self.is_empty():
+            raise Empty('Deque is empty')
+        answer = self._data[self._front]
+        self._data[self._front] = None  # help garbage collection
+        self._front = (self._front + 1) % len(self._data)
+        self._size -= 1
+        self._shrink()
+        return answer
+
+    def delete_last(self):
+        """
+        Remove and return the element from the back of the deque.
+        Raise Empty exception if the deque is empty.
+        """
+        if self.is_empty():
+            raise Empty('Deque is empty')
+        back = self._index(self._size - 1)
+        answer = self._data[back]
+        self._data[back] = None  # help garbage collection
+        self._size -= 1
+        self._shrink()
+        return answer
+
+    def extend_right(self, iterable):
+        """
+        Add the elements of iterable, in order, to the back of the deque.
+        """
+        values = list(iterable)
+        if self._size + len(values) > len(self._data):
+            self._resize(max(2 * len(self._data), self._size + len(values)))
+        cap = len(self._data)
+        start = self._index(self._size)
+        # the free slots run from start, possibly wrapping around once
+        head = min(len(values), cap - start)
+        self._data[start:start + head] = values[:head]
+        self._data[:len(values) - head] = values[head:]
+        self._size += len(values)
+
+    def extend_left(self, iterable):
+        """
+        Add the elements of iterable to the front of the deque, one at a time,
+        so they end up in reverse order (as collections.deque.extendleft).
+        """
+        values = list(iterable)
+        values.reverse()
+        if self._size + len(values) > len(self._data):
+            self._resize(max(2 * len(self._data), self._size + len(values)))
+        cap = len(self._data)
+        self._front = (self._front - len(values)) % cap
+        head = min(len(values), cap - self._front)
+        self._data[self._front:self._front + head] = values[:head]
+        self._data[:len(values) - head] = values[head:]
+        self._size += len(values)
+
+    def rotate(self, r=1):
+        """
+        Rotate the deque r steps to the right (to the left if r is negative).
+        """
+        if self._size <= 1:
+            return
+        r %= self._size
+        if self._size == len(self._data):
+            # no free slots: rotation is just a move of the front index
+            self._front = (self._front - r) % len(self._data)
+        elif r <= self._size // 2:
+            # move the r back elements, one by one, in front of the front
+            for _ in range(r):
+                back = self._index(self._size - 1)
+                self._front = (self._front - 1) % len(self._data)
+                self._data[self._front] = self._data[back]
+                self._data[back] = None
+        else:
+            # cheaper to move the n - r front elements behind the back
+            for _ in range(self._size - r):
+                self._data[self._index(self._size)] = self._data[self._front]
+                self._data[self._front] = None
+                self._front = (self._front + 1) % len(self._data)
+
+    def _shrink(self):
+        """
+        Halve the capacity once the deque falls below a quarter full.
+        """
+        cap = len(self._data)
+        if cap > ArrayDeque.DEFAULT_CAPACITY and self._size < cap // 4:
+            self._resize(cap // 2)
+
+    def _resize(self, cap):  # we assume cap >= len(self)
+        """
+        Resize to a new list of capacity >= len(self).
+        """
+        old = self._data  # keep track of existing list
+        self._data = [None] * cap  # allocate list with new capacity
+        # the elements form at most two contiguous runs of old
+        head = min(self._size, len(old) - self._front)
+        self._data[:head] = old[self._front:self._front + head]
+        self._data[head:self._size] = old[:self._size - head]
+        self._front = 0  # front has been realigned
@@ -0,0 +1,131 @@
+import asyncio
+import time
+from collections import deque
+
+from core.exceptions import Empty
+from .heapq import HeapPriorityQueue
+
+
+class AsyncPriorityQueue:
+    """
+    Priority queue for asyncio coroutines, wrapping one of the package's
+    priority queues (a HeapPriorityQueue by default).
+
+    get() waits while the queue is empty. Getters are served in arrival
+    order: only the oldest waiting one looks at the queue, and a newcomer
+    never overtakes it. In delay mode keys are deadlines on clock
+    (time.monotonic, the default event loop clock): an item is only handed
+    out once its deadline has passed, and the oldest getter sleeps until
+    the earliest one.
+    """
+
+    def __init__(self, pq=None, delay=False, clock=time.monotonic):
+        """
+        Wrap the priority queue pq (a new HeapPriorityQueue if None).
+        """
+        self._pq = HeapPriorityQueue() if pq is None else pq
+        self._delay = delay
+        self._clock = clock
+        # events of coroutines waiting in get(), oldest first
+        self._getters = deque()
+
+    def __len__(self):
+        """
+        Return the number of items in the queue, due or not.
+        """
+        return len(self._pq)
+
+    def is_empty(self):
+        """
+        Return True if the queue is empty.
+        """
+        return self._pq.is_empty()
+
+    # nonpublic behaviors
+    def _wake(self):
+        """
+        Wake the oldest waiting getter, if any, to look at the queue.
+        """
+        if self._getters:
+            self._getters[0].set()
+
+    def _wait_time(self):
+        """
+        Return seconds until the minimum may be removed (<= 0 if now, None if empty).
+        """
+        if self._pq.is_empty():
+            return None
+        if not self._delay:
+            return 0
+        return self._pq.min()[0] - self._clock()
+
+    # public behaviors
+    def add(self, key, value):
+        """
+        Add a key-value pair and return what the wrapped queue's add returns
+        (a locator for adaptable queues).
+        """
+        result = self._pq.add(key, value)
+        self._wake()
+        return result
+
+    def add_many(self, pairs):
+        """
+        Add all (key, value) pairs; the getters woken take them in turn.
+        """
+        for key, value in pairs:
+            self._pq.add(key, value)
+        self._wake()
+
+    def min(self):
+        """
+        Return but do not remove (k, v) tuple with minimum key, due or not.
+        Raise Empty exception if empty.
+        """
+        return self._pq.min()
+
+    def get_nowait(self):
+        """
+        Remove and return (k, v) tuple with minimum key (in delay mode, if due).
+        Raise Empty exception if none is available for a newcomer.
+        """
+        # waiting getters come first
+        if self._getters:
+            raise Empty('Priority queue is empty.')
+        wait = self._wait_time()
+        if wait is None or wait > 0:
+            raise Empty('Priority queue is empty.')
+        return self._pq.remove_min()
+
+    async def get(self):
+        """
+        Remove and return (k, v) tuple with minimum key, waiting for one
+        (in delay mode, for one that is due) if needed.
+        """
+        try:
+            return self.get_nowait()
+        except Empty:
+            pass
+        loop = asyncio.get_running_loop()
+        event = asyncio.Event()
+        self._getters.append(event)
+        try:
+            while True:
+                wait = None
+                if self._getters[0] is event:
+                    # our turn: take the minimum if it is due
+                    wait = self._wait_time()
+                    if wait is not None and wait <= 0:
+                        return self._pq.remove_min()
+                event.clear()
+                # woken by add or by the getter ahead, or at the next deadline
+                timer = None if wait is None else loop.call_later(wait, event.set)
+                try:
+                    await event.wait()
+                finally:
+                    if timer is not None:
+                        timer.cancel()
+        finally:
+            # leave the line, served or cancelled, and let the next getter look
+            self._getters.remove(event)
+            self._wake()
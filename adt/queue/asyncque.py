@@ -0,0 +1,205 @@
+import asyncio
+from collections import deque
+
+from core.exceptions import Empty, Full
+from .arrayque import ArrayQueue
+from .cirqueue import CircularQueue
+from .linkedque import LinkedQueue
+
+
+class AsyncQueue:
+    """
+    Bounded FIFO queue for asyncio coroutines, adapting one of the package's
+    synchronous queues (LinkedQueue by default) as storage.
+
+    put() waits while the queue is full and get() while it is empty. Waiters
+    are served in arrival order and each item (or freed slot) wakes exactly one
+    of them; a woken waiter keeps its turn, so later callers cannot overtake it.
+    The optional watermark callbacks fire when the size climbs to high_water
+    and, after that, when it drains back to low_water.
+    """
+    _storage_type = LinkedQueue
+
+    def __init__(self, maxsize=0, high_water=None, low_water=None, on_high=None, on_low=None):
+        """
+        Create an empty queue holding at most maxsize items (unbounded if maxsize <= 0).
+        """
+        self._storage = self._storage_type()
+        self._maxsize = maxsize
+        # futures of coroutines waiting in get() and put(), oldest first
+        self._getters = deque()
+        self._putters = deque()
+        # items (and free slots) promised to woken waiters that have not run yet
+        self._reserved_items = 0
+        self._reserved_slots = 0
+        self._high_water = high_water
+        self._low_water = low_water if low_water is not None else high_water
+        self._on_high = on_high
+        self._on_low = on_low
+        self._above_high = False
+
+    def __len__(self):
+        """
+        Return the number of items in the queue.
+        """
+        return len(self._storage)
+
+    def is_empty(self):
+        """
+        Return True if the queue is empty.
+        """
+        return len(self._storage) == 0
+
+    def is_full(self):
+        """
+        Return True if the queue holds maxsize items.
+        """
+        return 0 < self._maxsize <= len(self._storage)
+
+    # nonpublic behaviors
+    @staticmethod
+    def _wake(waiters):
+        """
+        Wake the oldest waiter still pending; return True if there was one.
+        """
+        while waiters:
+            fut = waiters.popleft()
+            if not fut.done():
+                fut.set_result(None)
+                return True
+        return False
+
+    def _store(self, item):
+        """
+        Enqueue item and hand it to the oldest waiting getter, if any.
+        """
+        self._storage.enqueue(item)
+        if self._wake(self._getters):
+            self._reserved_items += 1
+        if self._high_water is not None and not self._above_high and len(self._storage) >= self._high_water:
+            self._above_high = True
+            if self._on_high is not None:
+                self._on_high(self)
+
+    def _take(self):
+        """
+        Dequeue an item and hand the freed slot to the oldest waiting putter, if any.
+        """
+        item = self._storage.dequeue()
+        if self._maxsize > 0 and self._wake(self._putters):
+            self._reserved_slots += 1
+        if self._above_high and len(self._storage) <= self._low_water:
+            self._above_high = False
+            if self._on_low is not None:
+                self._on_low(self)
+        return item
+
+    async def _wait(self, waiters):
+        """
+        Wait in line until woken; return True, or raise if cancelled first.
+        Return False if cancelled after being woken, so the reservation can be passed on.
+        """
+        fut = asyncio.get_running_loop().create_future()
+        waiters.append(fut)
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                # woken, then cancelled: give our turn to the next waiter
+                return False
+            try:
+                waiters.remove(fut)
+            except ValueError:
+                pass
+            raise
+        return True
+
+    # public behaviors
+    def put_nowait(self, item):
+        """
+        Add an item to the back of the queue.
+        Raise Full exception if it has no free slot for a newcomer.
+        """
+        if self._putters or (self._maxsize > 0 and len(self._storage) + self._reserved_slots >= self._maxsize):
+            raise Full('Queue is full')
+        self._store(item)
+
+    async def put(self, item):
+        """
+        Add an item to the back of the queue, waiting for a free slot if needed.
+        """
+        try:
+            self.put_nowait(item)
+            return
+        except Full:
+            pass
+        if not await self._wait(self._putters):
+            # cancelled after being woken: pass the slot on, then propagate
+            self._reserved_slots -= 1
+            if self._wake(self._putters):
+                self._reserved_slots += 1
+            raise asyncio.CancelledError
+        self._reserved_slots -= 1
+        self._store(item)
+
+    def get_nowait(self):
+        """
+        Remove and return the item at the front of the queue.
+        Raise Empty exception if no item is available for a newcomer.
+        """
+        if self._getters or len(self._storage) <= self._reserved_items:
+            raise Empty('Queue is empty')
+        return self._take()
+
+    async def get(self):
+        """
+        Remove and return the item at the front of the queue, waiting for one if needed.
+        """
+        try:
+            return self.get_nowait()
+        except Empty:
+            pass
+        if not await self._wait(self._getters):
+            self._reserved_items -= 1
+            if self._wake(self._getters):
+                self._reserved_items += 1
+            raise asyncio.CancelledError
+        self._reserved_items -= 1
+        return self._take()
+
+    async def get_many(self, max_n, timeout=None):
+        """
+        Remove and return a list of up to max_n items from the front of the queue.
+        Wait up to timeout seconds (forever if None) for the first item, and
+        return an empty list if none arrives in time.
+        """
+        if max_n <= 0:
+            return []
+        try:
+            batch = [await asyncio.wait_for(self.get(), timeout)]
+        except asyncio.TimeoutError:
+            return []
+        while len(batch) < max_n and len(self._storage) > self._reserved_items:
+            batch.append(self._take())
+        return batch
+
+
+class AsyncLinkedQueue(AsyncQueue):
+    """
+    AsyncQueue stored in a LinkedQueue.
+    """
+    _storage_type = LinkedQueue
+
+
+class AsyncArrayQueue(AsyncQueue):
+    """
+    AsyncQueue stored in an ArrayQueue.
+    """
+    _storage_type = ArrayQueue
+
+
+class AsyncCircularQueue(AsyncQueue):
+    """
+    AsyncQueue stored in a CircularQueue.
+    """
+    _storage_type = CircularQueue
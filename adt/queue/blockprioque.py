@@ -0,0 +1,128 @@
+import threading
+import time
+
+from core.exceptions import Empty
+from .blockque import BlockingQueue
+from .heapq import HeapPriorityQueue
+
+
+class BlockingPriorityQueue:
+    """
+    Thread-safe wrapper around one of the package's priority queues
+    (a HeapPriorityQueue by default).
+
+    One lock guards the wrapped queue and consumers wait on the not_empty
+    condition. In delay mode keys are deadlines on clock (time.monotonic by
+    default): an item can only be removed once its deadline has passed,
+    and consumers sleep until the earliest one instead of polling.
+    """
+
+    def __init__(self, pq=None, delay=False, clock=time.monotonic):
+        """
+        Wrap the priority queue pq (a new HeapPriorityQueue if None).
+        """
+        self._pq = HeapPriorityQueue() if pq is None else pq
+        self._delay = delay
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+
+    def __len__(self):
+        """
+        Return the number of items in the queue, due or not.
+        """
+        with self._lock:
+            return len(self._pq)
+
+    def is_empty(self):
+        """
+        Return True if the queue is empty.
+        """
+        return len(self) == 0
+
+    # nonpublic behaviors, called with the lock held
+    def _wait_time(self):
+        """
+        Return seconds until the minimum may be removed (<= 0 if now, None if empty).
+        """
+        if self._pq.is_empty():
+            return None
+        if not self._delay:
+            return 0
+        return self._pq.min()[0] - self._clock()
+
+    def _is_due(self):
+        """
+        Return True if the minimum may be removed now.
+        """
+        wait = self._wait_time()
+        return wait is not None and wait <= 0
+
+    def _take(self):
+        """
+        Remove the minimum; in delay mode let another consumer look at the next deadline.
+        """
+        item = self._pq.remove_min()
+        if self._delay and not self._pq.is_empty():
+            self._not_empty.notify()
+        return item
+
+    # public behaviors
+    def add(self, key, value):
+        """
+        Add a key-value pair and return what the wrapped queue's add returns
+        (a locator for adaptable queues).
+        """
+        with self._not_empty:
+            result = self._pq.add(key, value)
+            self._not_empty.notify()
+            return result
+
+    def add_many(self, pairs):
+        """
+        Add all (key, value) pairs under a single lock acquisition.
+        """
+        with self._not_empty:
+            count = 0
+            for key, value in pairs:
+                self._pq.add(key, value)
+                count += 1
+            # every new item may serve one waiting consumer
+            self._not_empty.notify(count)
+
+    def update(self, loc, newkey, newval):
+        """
+        Update the entry identified by loc (adaptable queues only).
+        """
+        with self._not_empty:
+            self._pq.update(loc, newkey, newval)
+            # the minimum, or its deadline, may have changed
+            self._not_empty.notify()
+
+    def remove(self, loc):
+        """
+        Remove and return the (k, v) pair identified by loc (adaptable queues only).
+        """
+        with self._lock:
+            return self._pq.remove(loc)
+
+    def min(self):
+        """
+        Return but do not remove (k, v) tuple with minimum key, due or not.
+        Raise Empty exception if empty.
+        """
+        with self._lock:
+            return self._pq.min()
+
+    def remove_min(self, block=True, timeout=None):
+        """
+        Remove and return (k, v) tuple with minimum key, waiting for one
+        (in delay mode, for one that is due) if needed.
+        Raise Empty exception if none is available (at once if block is
+        False, else within timeout seconds).
+        """
+        with self._not_empty:
+            # woken early by add, or at the next deadline
+            BlockingQueue._wait(self._not_empty, self._is_due, block, timeout,
+                                Empty('Priority queue is empty.'), self._wait_time)
+            return self._take()
@@ -0,0 +1,156 @@
+import threading
+import time
+
+from core.exceptions import Empty, Full
+from .arrayque import ArrayQueue
+
+
+class BlockingQueue:
+    """
+    Thread-safe multi-producer/multi-consumer FIFO queue stored in an ArrayQueue.
+
+    One lock guards the storage; threads wait on the not_empty/not_full
+    conditions. put_many/get_many move a whole batch per lock acquisition.
+    As with the standard library's queue.Queue, every item put must later be
+    marked with task_done() for join() to return.
+    """
+
+    def __init__(self, maxsize=0):
+        """
+        Create an empty queue holding at most maxsize items (unbounded if maxsize <= 0).
+        """
+        self._data = ArrayQueue()
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._all_tasks_done = threading.Condition(self._lock)
+        # items put but not yet marked done
+        self._unfinished = 0
+
+    def __len__(self):
+        """
+        Return the number of items in the queue.
+        """
+        with self._lock:
+            return len(self._data)
+
+    def is_empty(self):
+        """
+        Return True if the queue is empty.
+        """
+        return len(self) == 0
+
+    # nonpublic behaviors, called with the lock held
+    def _room(self):
+        """
+        Return how many more items fit (None if unbounded).
+        """
+        if self._maxsize <= 0:
+            return None
+        return self._maxsize - len(self._data)
+
+    @staticmethod
+    def _wait(cond, ready, block, timeout, error, wait_time=None):
+        """
+        Wait on cond until ready() is true, raising error if it cannot be in time.
+        If given, wait_time() bounds each sleep (None for no bound): ready()
+        may turn true by then without a notify.
+        """
+        if ready():
+            return
+        if not block:
+            raise error
+        if timeout is not None and timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not ready():
+            wait = None if wait_time is None else wait_time()
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise error
+                wait = remaining if wait is None else min(wait, remaining)
+            cond.wait(wait)
+
+    # public behaviors
+    def put(self, item, block=True, timeout=None):
+        """
+        Add an item to the back of the queue, waiting for a free slot if needed.
+        Raise Full exception if none frees up (at once if block is False,
+        else within timeout seconds).
+        """
+        with self._not_full:
+            if 0 < self._maxsize <= len(self._data):
+                self._wait(self._not_full, lambda: self._room() != 0, block, timeout, Full('Queue is full'))
+            self._data.enqueue(item)
+            self._unfinished += 1
+            self._not_empty.notify()
+
+    def put_many(self, items, timeout=None):
+        """
+        Add all items to the back of the queue, in order, waiting for room as needed.
+        Each lock acquisition moves as many items as fit.
+        Raise Full exception if room does not free up within timeout seconds;
+        the items put before that stay in the queue.
+        """
+        items = list(items)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        start = 0
+        while start < len(items):
+            with self._not_full:
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                self._wait(self._not_full, lambda: self._room() != 0, True, remaining, Full('Queue is full'))
+                room = self._room()
+                stop = len(items) if room is None else min(len(items), start + room)
+                self._data.enqueue_many(items[start:stop])
+                self._unfinished += stop - start
+                # every newly available item may serve one waiting consumer
+                self._not_empty.notify(stop - start)
+            start = stop
+
+    def get(self, block=True, timeout=None):
+        """
+        Remove and return the item at the front of the queue, waiting for one if needed.
+        Raise Empty exception if none arrives (at once if block is False,
+        else within timeout seconds).
+        """
+        with self._not_empty:
+            if self._data.is_empty():
+                self._wait(self._not_empty, lambda: len(self._data) > 0, block, timeout, Empty('Queue is empty'))
+            item = self._data.dequeue()
+            self._not_full.notify()
+            return item
+
+    def get_many(self, max_n, block=True, timeout=None):
+        """
+        Remove and return a list of up to max_n items, waiting (as get does)
+        only for the first one.
+        """
+        if max_n <= 0:
+            return []
+        with self._not_empty:
+            self._wait(self._not_empty, lambda: len(self._data) > 0, block, timeout, Empty('Queue is empty'))
+            batch = self._data.dequeue_many(max_n)
+            self._not_full.notify(len(batch))
+            return batch
+
+    def task_done(self, n=1):
+        """
+        Mark n previously gotten items as processed.
+        """
+        with self._all_tasks_done:
+            unfinished = self._unfinished - n
+            if unfinished < 0:
+                raise ValueError('task_done() called too many times')
+            self._unfinished = unfinished
+            if unfinished == 0:
+                self._all_tasks_done.notify_all()
+
+    def join(self):
+        """
+        Block until every item put into the queue has been marked done.
+        """
+        with self._all_tasks_done:
+            while self._unfinished:
+                self._all_tasks_done.wait()
@@ -0,0 +1,137 @@
+import bisect
+
+from core.exceptions import Empty
+from .proique import PriorityQueueBase
+
+
+class CalendarQueue(PriorityQueueBase):
+    """
+    A min-oriented priority queue for numeric keys, implemented as a calendar queue (Brown, 1988).
+
+    Keys fall into "days" of a fixed width; day d is kept in bucket
+    d % nbuckets, a short sorted list, so the buckets form a year that
+    repeats. remove_min scans forward from the day of the last minimum.
+    The bucket count doubles or halves as the size leaves [nbuckets/2,
+    2*nbuckets], and the width is then re-estimated from the gaps between
+    the smallest keys. When key gaps are stable, as in the hold model of
+    discrete-event simulation, add and remove_min take O(1) amortized time.
+    """
+    MIN_BUCKETS = 2  # the calendar never shrinks below this
+    SAMPLE_SIZE = 25  # keys sampled to estimate a new width
+
+    # nonpublic behaviors
+    def _locate(self):
+        """
+        Return the bucket holding the minimum, advancing the current day to it.
+        """
+        buckets = self._buckets
+        n = len(buckets)
+        width = self._width
+        day = self._day
+        for _ in range(n):
+            bucket = buckets[day % n]
+            # the head belongs to today, not to a later year
+            if bucket and bucket[0]._key // width <= day:
+                self._day = day
+                return bucket
+            day += 1
+        # a whole year without an event: jump straight to the minimum
+        bucket = min((b for b in buckets if b), key=lambda b: b[0]._key)
+        self._day = int(bucket[0]._key // width)
+        return bucket
+
+    def _pop(self):
+        """
+        Remove and return the item with minimum key.
+        """
+        item = self._locate().pop(0)
+        self._size -= 1
+        return item
+
+    def _estimate_width(self, samples):
+        """
+        Return a bucket width suited to the sorted samples (or None if they tell nothing).
+        """
+        if len(samples) < 2:
+            return None
+        gaps = [b._key - a._key for a, b in zip(samples, samples[1:])]
+        average = sum(gaps) / len(gaps)
+        # ignore outliers well above the average
+        usual = [g for g in gaps if g <= 2 * average]
+        width = 3 * sum(usual) / len(usual)
+        return width if width > 0 else None
+
+    def _resize(self, nbuckets):
+        """
+        Redistribute all items over nbuckets buckets with a freshly estimated width.
+        """
+        # as Brown does, sample the gaps between the next items due
+        samples = [self._pop() for _ in range(min(self._size, self.SAMPLE_SIZE))]
+        self._width = self._estimate_width(samples) or self._width
+        items = [item for bucket in self._buckets for item in bucket]
+        items.extend(samples)
+        self._buckets = [[] for _ in range(nbuckets)]
+        for item in items:
+            self._buckets[int(item._key // self._width) % nbuckets].append(item)
+        for bucket in self._buckets:
+            bucket.sort()
+        self._size = len(items)
+        self._day = int(min(item._key for item in items) // self._width) if items else 0
+
+    # public behaviors
+    def __init__(self, width=1.0):
+        """
+        Create a new empty priority queue with an initial bucket width.
+        """
+        self._buckets = [[] for _ in range(self.MIN_BUCKETS)]
+        self._width = width
+        # day of the last minimum; no key lies in an earlier day
+        self._day = 0
+        self._size = 0
+
+    def __len__(self):
+        """
+        Return the number of items in the priority queue.
+        """
+        return self._size
+
+    def add(self, key, value):
+        """
+        Add a key-value pair to the priority queue.
+        """
+        day = int(key // self._width)
+        if day < self._day:
+            # an event in the past of the scan: restart from its day
+            self._day = day
+        bucket = self._buckets[day % len(self._buckets)]
+        item = self._Item(key, value)
+        if not bucket or not item < bucket[-1]:
+            # usual case: latest of its bucket
+            bucket.append(item)
+        else:
+            bisect.insort_right(bucket, item)
+        self._size += 1
+        if self._size > 2 * len(self._buckets):
+            self._resize(2 * len(self._buckets))
+
+    def min(self):
+        """
+        Return but do not remove (k, v) tuple with minimum key.
+        Raise Empty exception if empty.
+        """
+        if self.is_empty():
+            raise Empty('Priority queue is empty.')
+        item = self._locate()[0]
+        return item._key, item._value
+
+    def remove_min(self):
+        """
+        Remove and return (k, v) tuple with minimum key.
+        Raise Empty exception if empty.
+        """
+        if self.is_empty():
+            raise Empty('Priority queue is empty.')
+        item = self._pop()
+        if len(self._buckets) > self.MIN_BUCKETS and self._size < len(self._buckets) // 2:
+            self._resize(len(self._buckets) // 2)
+        return item._key, item._value
@@ -7,10 +7,12 @@ class CircularQueue:
     Queue implementation using circularly linked list for storage.
     """
 
-    def __init__(self):
+    def __init__(self, pool=None):
         """
         Create an empty queue.
+        Nodes are recycled through pool (a SinglyNodePool) if one is given.
         """
+        self._pool = pool
         # will represent tail of queue
         self._tail = None
         # number of queue elements
@@ -54,14 +56,20 @@ class CircularQueue:
             # bypass the old head
             self._tail._next = oldhead._next
         self._size -= 1
-        return oldhead._next
+        answer = oldhead._element
+        if self._pool is not None:
+            self._pool.release(oldhead)
+        return answer
 
     def enqueue(self, e):
         """
         Add an element to the back of queue.
         """
         # node will be new tail node
-        newest = _Node(e, None)
+        if self._pool is None:
+            newest = _Node(e, None)
+        else:
+            newest = self._pool.acquire(e, None)
         if self.is_empty():
             # initialize circularly
             newest._next = newest
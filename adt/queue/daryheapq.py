@@ -0,0 +1,162 @@
+import ctypes
+
+from core.exceptions import Empty
+from .proique import PriorityQueueBase
+
+# typecodes accepted for native key storage, mapped to their ctypes element type
+_TYPECODES = {
+    'd': ctypes.c_double,
+    'q': ctypes.c_longlong,
+}
+
+
+class DaryHeapPriorityQueue(PriorityQueueBase):
+    """
+    A min-oriented priority queue implemented with a d-ary heap.
+
+    Keys and values are kept in two parallel arrays instead of a list of
+    items, so the sift loops compare keys directly. With a typecode ('d' for
+    floats, 'q' for 64-bit integers) the keys are stored unboxed in a native
+    ctypes buffer. A wider heap is shallower: add takes O(log_d n) steps and
+    remove_min O(d log_d n).
+    """
+
+    # nonpublic behaviors
+    def _resize(self, c):
+        """
+        Resize the native key buffer to capacity c.
+        """
+        # see ctypes documentation
+        bigger = (c * _TYPECODES[self._typecode])()
+        n = len(self._values)
+        ctypes.memmove(bigger, self._keys, n * ctypes.sizeof(self._keys._type_))
+        self._keys = bigger
+
+    def _unheap(self, j, key, value):
+        """
+        Place key and value at index j or above, moving larger ancestors down.
+        """
+        keys = self._keys
+        values = self._values
+        d = self._arity
+        while j > 0:
+            parent = (j - 1) // d
+            parent_key = keys[parent]
+            if not key < parent_key:
+                break
+            keys[j] = parent_key
+            values[j] = values[parent]
+            j = parent
+        keys[j] = key
+        values[j] = value
+
+    def _downheap(self, j, key, value):
+        """
+        Place key and value at index j or below, moving smaller children up.
+        """
+        keys = self._keys
+        values = self._values
+        d = self._arity
+        n = len(values)
+        child = d * j + 1
+        while child < n:
+            # find the smallest of up to d children
+            child_key = keys[child]
+            c = child + 1
+            last = child + d
+            if last > n:
+                last = n
+            while c < last:
+                if keys[c] < child_key:
+                    child = c
+                    child_key = keys[c]
+                c += 1
+            if not child_key < key:
+                break
+            keys[j] = child_key
+            values[j] = values[child]
+            j = child
+            child = d * j + 1
+        keys[j] = key
+        values[j] = value
+
+    # public behaviors
+    def __init__(self, arity=4, typecode=None):
+        """
+        Create a new empty priority queue of the given arity (at least 2).
+        Keys are arbitrary comparable objects unless typecode is given.
+        """
+        if arity < 2:
+            raise ValueError('arity must be at least 2')
+        self._arity = arity
+        self._typecode = typecode
+        if typecode is None:
+            self._keys = []
+        elif typecode in _TYPECODES:
+            # native buffer of moderate capacity, doubled when full
+            self._keys = (10 * _TYPECODES[typecode])()
+        else:
+            raise ValueError('bad typecode (must be one of ' + ''.join(_TYPECODES) + ')')
+        self._values = []
+
+    @property
+    def arity(self):
+        """
+        Number of children of each node.
+        """
+        return self._arity
+
+    def __len__(self):
+        """
+        Return the number of items in the priority queue.
+        """
+        return len(self._values)
+
+    def add(self, key, value):
+        """
+        Add a key-value pair to the priority queue.
+        With a typecode, raise TypeError or OverflowError if the key cannot be stored exactly.
+        """
+        if self._typecode is not None:
+            # convert before either array changes; ctypes silently truncates integers
+            native = _TYPECODES[self._typecode](key).value
+            if self._typecode == 'q' and native != key:
+                raise OverflowError("key {0!r} out of range for typecode 'q'".format(key))
+            key = native
+        n = len(self._values)
+        # grow both arrays, then sift up from the new slot
+        if self._typecode is None:
+            self._keys.append(key)
+        elif n == len(self._keys):
+            # not enough room, so double capacity
+            self._resize(2 * n)
+        self._values.append(value)
+        self._unheap(n, key, value)
+
+    def min(self):
+        """
+        Return but do not remove (k, v) tuple with minimum key.
+        Raise Empty exception if empty.
+        """
+        if self.is_empty():
+            raise Empty('Priority queue is empty.')
+        return self._keys[0], self._values[0]
+
+    def remove_min(self):
+        """
+        Remove and return (k, v) tuple with minimum key.
+        Raise Empty exception if empty.
+        """
+        if self.is_empty():
+            raise Empty('Priority queue is empty.')
+        answer = self._keys[0], self._values[0]
+        value = self._values.pop()
+        n = len(self._values)
+        if self._typecode is None:
+            key = self._keys.pop()
+        else:
+            key = self._keys[n]
+        if self._values:
+            # move the last item to the root, then fix new root
+            self._downheap(0, key, value)
+        return answer
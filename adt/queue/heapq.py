@@ -32,25 +32,49 @@ class HeapPriorityQueue(PriorityQueueBase):
         self._data[i], self._data[j] = self._data[j], self._data[i]
 
     def _unheap(self, j):
-        parent = self._parent(j)
-        if j > 0 and self._data[j] < self._data[parent]:
-            self._swap(j, parent)
-            # recur at position of parent
-            self._unheap(parent)
+        """
+        Move the item at index j up to its place and return its final index.
+        """
+        data = self._data
+        item = data[j]
+        key = item._key
+        # shift larger ancestors down into the hole instead of swapping
+        while j > 0:
+            parent = (j - 1) // 2
+            if not key < data[parent]._key:
+                break
+            data[j] = data[parent]
+            j = parent
+        data[j] = item
+        return j
 
     def _downheap(self, j):
-        if self._has_left(j):
-            left = self._left(j)
+        """
+        Move the item at index j down to its place and return its final index.
+        """
+        data = self._data
+        n = len(data)
+        item = data[j]
+        key = item._key
+        child = 2 * j + 1
+        while child < n:
             # although right may be smaller
-            small_child = left
-            if self._has_right(j):
-                right = self._right(j)
-                if self._data[right] < self._data[left]:
-                    small_child = right
-            if self._data[small_child] < self._data[j]:
-                self._swap(j, small_child)
-                # recur at position of small child
-                self._downheap(small_child)
+            if child + 1 < n and data[child + 1]._key < data[child]._key:
+                child += 1
+            if not data[child]._key < key:
+                break
+            data[j] = data[child]
+            j = child
+            child = 2 * j + 1
+        data[j] = item
+        return j
+
+    def _heapify(self):
+        """
+        Restore the heap order of the whole array bottom-up, in O(n) time.
+        """
+        for j in range(len(self._data) // 2 - 1, -1, -1):
+            self._downheap(j)
 
     # public behaviors
     def __init__(self):
@@ -59,6 +83,16 @@ class HeapPriorityQueue(PriorityQueueBase):
         """
         self._data = []
 
+    @classmethod
+    def from_items(cls, iterable):
+        """
+        Create a priority queue holding the (key, value) pairs of iterable, in O(n) time.
+        """
+        pq = cls()
+        pq._data = [pq._Item(k, v) for k, v in iterable]
+        pq._heapify()
+        return pq
+
     def __len__(self):
         """
         Return the number of items in the priority queue.
@@ -90,10 +124,75 @@ class HeapPriorityQueue(PriorityQueueBase):
         """
         if self.is_empty():
             raise Empty('Priority queue is empty.')
-        # put minimum item at the end
-        self._swap(0, len(self._data) - 1)
-        # and remove it from the list
-        item = self._data.pop()
-        # then fix new root
+        item = self._data[0]
+        last = self._data.pop()
+        if self._data:
+            # move the last item to the root, then fix new root
+            self._data[0] = last
+            self._downheap(0)
+        return item._key, item._value
+
+    def pushpop(self, key, value):
+        """
+        Add a key-value pair, then remove and return (k, v) tuple with minimum key.
+        Takes a single sift, and none if the new key is the minimum.
+        """
+        if not self._data or not self._data[0]._key < key:
+            return key, value
+        item = self._data[0]
+        self._data[0] = self._Item(key, value)
+        self._downheap(0)
+        return item._key, item._value
+
+    def replace(self, key, value):
+        """
+        Remove and return (k, v) tuple with minimum key, then add a key-value pair.
+        Takes a single sift. Raise Empty exception if empty.
+        """
+        if self.is_empty():
+            raise Empty('Priority queue is empty.')
+        item = self._data[0]
+        self._data[0] = self._Item(key, value)
         self._downheap(0)
         return item._key, item._value
+
+    def merge(self, other):
+        """
+        Move all entries of the heap priority queue other into this one, leaving other empty.
+        Raise TypeError if other is not a heap priority queue.
+        """
+        if not isinstance(other, HeapPriorityQueue):
+            raise TypeError('other must be a heap priority queue')
+        if other is self or other.is_empty():
+            return
+        items = other._data
+        n = len(self._data)
+        self._data.extend(items)
+        other._data = []
+        total = len(self._data)
+        if len(items) * total.bit_length() < total:
+            # few newcomers: sift each one up
+            for j in range(n, total):
+                self._unheap(j)
+        else:
+            self._heapify()
+
+    def nsmallest(self, k):
+        """
+        Return a list of the (k, v) tuples with the k smallest keys, in order,
+        without modifying the priority queue. Takes O(k log k) time.
+        """
+        data = self._data
+        result = []
+        if k <= 0 or not data:
+            return result
+        # the smallest unreported items are children of reported ones
+        frontier = HeapPriorityQueue()
+        frontier.add(data[0]._key, 0)
+        while len(result) < k and not frontier.is_empty():
+            _, j = frontier.remove_min()
+            result.append((data[j]._key, data[j]._value))
+            for child in (2 * j + 1, 2 * j + 2):
+                if child < len(data):
+                    frontier.add(data[child]._key, child)
+        return result
@@ -0,0 +1,98 @@
+from .heapq import HeapPriorityQueue
+
+
+class _Reversed:
+    """
+    Lightweight, nonpublic key wrapper inverting the order, so a min-heap acts as a max-heap.
+    """
+    __slots__ = '_key'
+
+    def __init__(self, key):
+        self._key = key
+
+    def __lt__(self, other):
+        return other._key < self._key
+
+
+def _rank(key, index, largest):
+    """
+    Return the heap key of the element with key at position index: the
+    heap's minimum is the next to go, the worst key and, among equal keys, the latest.
+    """
+    return (key, -index) if largest else _Reversed((key, index))
+
+
+def _worst(pq, largest):
+    """
+    Return the key of the worst element kept in pq.
+    """
+    top = pq.min()[0]
+    return top[0] if largest else top._key[0]
+
+
+def _select(iterable, k, key, largest):
+    """
+    Return the k largest (or smallest) elements of iterable in order,
+    keeping a heap of the best k seen so far; equal elements keep their input order.
+    """
+    if k <= 0:
+        return []
+    it = iter(iterable)
+    pq = HeapPriorityQueue.from_items((_rank(elem if key is None else key(elem), index, largest), elem)
+                                      for index, elem in zip(range(k), it))
+    if len(pq) == k:
+        threshold = _worst(pq, largest)
+        for index, elem in enumerate(it, k):
+            kk = elem if key is None else key(elem)
+            # strictly better only: on a tie the earlier element stays
+            if (threshold < kk) if largest else (kk < threshold):
+                pq.replace(_rank(kk, index, largest), elem)
+                threshold = _worst(pq, largest)
+    result = [pq.remove_min()[1] for _ in range(len(pq))]
+    # best first
+    result.reverse()
+    return result
+
+
+def top_k(iterable, k, key=None):
+    """
+    Return a list of the k largest elements of iterable, largest first, in O(k) memory.
+    """
+    return _select(iterable, k, key, True)
+
+
+def bottom_k(iterable, k, key=None):
+    """
+    Return a list of the k smallest elements of iterable, smallest first, in O(k) memory.
+    """
+    return _select(iterable, k, key, False)
+
+
+def merge_sorted(*iterables, key=None):
+    """
+    Generate the elements of the sorted iterables in sorted order, lazily.
+    Only the current head of each input is held; equal elements come in
+    the order of the inputs.
+    """
+    heads = []
+    for order, iterable in enumerate(iterables):
+        it = iter(iterable)
+        for elem in it:
+            # the input's position breaks ties
+            heads.append(((elem if key is None else key(elem), order), (elem, it)))
+            break
+    pq = HeapPriorityQueue.from_items(heads)
+    while len(pq) > 1:
+        (_, order), (elem, it) = pq.min()
+        yield elem
+        for nxt in it:
+            pq.replace((nxt if key is None else key(nxt), order), (nxt, it))
+            break
+        else:
+            # this input is exhausted
+            pq.remove_min()
+    if not pq.is_empty():
+        # a single input left: no more comparisons needed
+        _, (elem, it) = pq.remove_min()
+        yield elem
+        yield from it
@@ -0,0 +1,146 @@
+from core.exceptions import Empty
+from .adaheapq import AdaptableHeapPriorityQueue
+from .proique import PriorityQueueBase
+
+# value of a heap entry whose id has been discarded (lazy mode)
+_TOMBSTONE = object()
+
+
+class IndexedPriorityQueue(PriorityQueueBase):
+    """
+    A min-oriented priority queue of hashable ids, each with a priority.
+
+    Entries live in an AdaptableHeapPriorityQueue as (priority, id) pairs and
+    a dict maps every id to its locator, so callers name entries by id.
+
+    In lazy mode discard and reprioritizing do not re-sift: the old entry is
+    marked as a tombstone (and the new priority added as a fresh entry).
+    Tombstones reaching the top are dropped by min and remove_min, and once
+    they make up more than threshold of the heap it is rebuilt in O(n).
+    """
+
+    # nonpublic behaviors
+    def _bury(self, loc):
+        """
+        Mark the entry of loc as a tombstone, compacting if there are too many.
+        """
+        loc._value = _TOMBSTONE
+        self._tombstones += 1
+        if self._tombstones > self._threshold * len(self._heap):
+            self._compact()
+
+    def _compact(self):
+        """
+        Rebuild the heap from its live entries, bottom-up.
+        """
+        # the live locators are kept, so the id index stays valid
+        self._heap._data = [loc for loc in self._heap._data if loc._value is not _TOMBSTONE]
+        self._heap._heapify()
+        self._tombstones = 0
+
+    def _prune(self):
+        """
+        Drop the tombstones at the top of the heap.
+        """
+        while self._tombstones and self._heap._data[0]._value is _TOMBSTONE:
+            self._heap.remove_min()
+            self._tombstones -= 1
+
+    # public behaviors
+    def __init__(self, lazy=False, threshold=0.5):
+        """
+        Create a new empty priority queue.
+        In lazy mode, tombstones are compacted once they exceed the threshold
+        fraction of the heap.
+        """
+        # tombstones never outnumber the heap, so at 1 compaction would never run
+        if not 0 < threshold < 1:
+            raise ValueError('threshold must be in (0, 1)')
+        self._heap = AdaptableHeapPriorityQueue()
+        # id -> locator of its live entry
+        self._locators = {}
+        self._lazy = lazy
+        self._threshold = threshold
+        self._tombstones = 0
+
+    def __len__(self):
+        """
+        Return the number of ids in the priority queue.
+        """
+        return len(self._locators)
+
+    def __contains__(self, item_id):
+        """
+        Return True if item_id is in the priority queue.
+        """
+        return item_id in self._locators
+
+    def contains(self, item_id):
+        """
+        Return True if item_id is in the priority queue.
+        """
+        return item_id in self._locators
+
+    def priority_of(self, item_id):
+        """
+        Return the priority of item_id (raise KeyError if not found).
+        """
+        loc = self._locators.get(item_id)
+        if loc is None:
+            raise KeyError('Key Error: ' + repr(item_id))
+        return loc._key
+
+    def upsert(self, item_id, priority):
+        """
+        Insert item_id with the given priority, or change the priority if it is present.
+        """
+        loc = self._locators.get(item_id)
+        if loc is None:
+            self._locators[item_id] = self._heap.add(priority, item_id)
+        elif not self._lazy:
+            self._heap.update(loc, priority, item_id)
+        else:
+            # bury the old entry first, as it may trigger a compaction
+            del self._locators[item_id]
+            self._bury(loc)
+            self._locators[item_id] = self._heap.add(priority, item_id)
+
+    def add(self, key, value):
+        """
+        Add value, an id, with priority key (changing its priority if it is present).
+        """
+        self.upsert(value, key)
+
+    def discard(self, item_id):
+        """
+        Remove item_id from the priority queue if it is present.
+        """
+        loc = self._locators.pop(item_id, None)
+        if loc is None:
+            return
+        if self._lazy:
+            self._bury(loc)
+        else:
+            self._heap.remove(loc)
+
+    def min(self):
+        """
+        Return but do not remove (priority, id) tuple with minimum priority.
+        Raise Empty exception if empty.
+        """
+        if self.is_empty():
+            raise Empty('Priority queue is empty.')
+        self._prune()
+        return self._heap.min()
+
+    def remove_min(self):
+        """
+        Remove and return (priority, id) tuple with minimum priority.
+        Raise Empty exception if empty.
+        """
+        if self.is_empty():
+            raise Empty('Priority queue is empty.')
+        self._prune()
+        priority, item_id = self._heap.remove_min()
+        del self._locators[item_id]
+        return priority, item_id
@@ -7,10 +7,12 @@ class LinkedQueue:
     FIFO queue implementation using a singly linked list for storage.
     """
 
-    def __init__(self):
+    def __init__(self, pool=None):
         """
         Create an empty queue.
+        Nodes are recycled through pool (a SinglyNodePool) if one is given.
         """
+        self._pool = pool
         self._head = None
         self._tail = None
         # number of queue elements
@@ -44,8 +46,11 @@ class LinkedQueue:
         """
         if self.is_empty():
             raise Empty('Queue is empty')
-        answer = self._head._element
-        self._head = self._head._next
+        oldhead = self._head
+        answer = oldhead._element
+        self._head = oldhead._next
+        if self._pool is not None:
+            self._pool.release(oldhead)
         self._size -= 1
         # special case as queue is empty
         if self.is_empty():
@@ -58,7 +63,10 @@ class LinkedQueue:
         Add an element to the back of queue.
         """
         # node will be new tail node
-        newest = _Node(e, None)
+        if self._pool is None:
+            newest = _Node(e, None)
+        else:
+            newest = self._pool.acquire(e, None)
         if self.is_empty():
             # special case: previously empty
             self._head = newest
@@ -0,0 +1,197 @@
+from core.exceptions import Empty
+from .proique import PriorityQueueBase
+
+
+class MinMaxHeapPriorityQueue(PriorityQueueBase):
+    """
+    A double-ended priority queue implemented with a min-max heap.
+
+    The array is a complete binary tree whose even levels (the root's
+    included) are min levels and odd levels max levels: an item on a min
+    level is no larger than anything below it, one on a max level no
+    smaller. The minimum is the root and the maximum one of its children;
+    add, remove_min and remove_max take O(log n) time.
+
+    With a capacity, add evicts from the end named by evict ('min' or
+    'max') once the queue is full, and returns the evicted (k, v) tuple.
+    """
+
+    # nonpublic behaviors
+    @staticmethod
+    def _is_min_level(j):
+        """
+        Return True if index j lies on a min level (its depth is even).
+        """
+        return (j + 1).bit_length() % 2 == 1
+
+    def _swap(self, i, j):
+        """
+        Swap the elements at indices i and j of array.
+        """
+        self._data[i], self._data[j] = self._data[j], self._data[i]
+
+    def _before(self, a, b, on_min):
+        """
+        Return True if item a belongs above item b on a min (or max) level.
+        """
+        return a._key < b._key if on_min else b._key < a._key
+
+    def _unheap_grandparents(self, j, on_min):
+        """
+        Move the item at j up through its grandparents on the same kind of level.
+        """
+        data = self._data
+        while j >= 3:
+            grand = ((j - 1) // 2 - 1) // 2
+            if not self._before(data[j], data[grand], on_min):
+                break
+            self._swap(j, grand)
+            j = grand
+
+    def _unheap(self, j):
+        """
+        Move the newly added item at index j up to its place.
+        """
+        if j == 0:
+            return
+        parent = (j - 1) // 2
+        on_min = self._is_min_level(j)
+        if self._before(self._data[parent], self._data[j], on_min):
+            # the item belongs on the parent's kind of level
+            self._swap(j, parent)
+            self._unheap_grandparents(parent, not on_min)
+        else:
+            self._unheap_grandparents(j, on_min)
+
+    def _downheap(self, j):
+        """
+        Move the item at index j down to its place, among items of the same kind of level.
+        """
+        data = self._data
+        n = len(data)
+        on_min = self._is_min_level(j)
+        while True:
+            first = 2 * j + 1
+            if first >= n:
+                return
+            # best of the up to two children and four grandchildren
+            best = first
+            for k in (first + 1, 2 * first + 1, 2 * first + 2, 2 * first + 3, 2 * first + 4):
+                if k < n and self._before(data[k], data[best], on_min):
+                    best = k
+            if best <= first + 1:
+                # a child: one swap at most, and it ends there
+                if self._before(data[best], data[j], on_min):
+                    self._swap(j, best)
+                return
+            if not self._before(data[best], data[j], on_min):
+                return
+            self._swap(j, best)
+            parent = (best - 1) // 2
+            if self._before(data[parent], data[best], on_min):
+                # the moved item is out of order with its parent on the other kind of level
+                self._swap(best, parent)
+            j = best
+
+    def _max_index(self):
+        """
+        Return index of the item with maximum key (the queue is not empty).
+        """
+        n = len(self._data)
+        if n == 1:
+            return 0
+        if n == 2 or not self._data[1]._key < self._data[2]._key:
+            return 1
+        return 2
+
+    def _remove_at(self, j):
+        """
+        Remove and return the item at index j.
+        """
+        item = self._data[j]
+        last = self._data.pop()
+        if j < len(self._data):
+            # move the last item into the hole, then fix it
+            self._data[j] = last
+            self._downheap(j)
+        return item
+
+    # public behaviors
+    def __init__(self, capacity=None, evict='min'):
+        """
+        Create a new empty priority queue, holding at most capacity items if given.
+        """
+        if capacity is not None and capacity < 1:
+            raise ValueError('capacity must be positive')
+        if evict not in ('min', 'max'):
+            raise ValueError("evict must be 'min' or 'max'")
+        self._data = []
+        self._capacity = capacity
+        self._evict = evict
+
+    def __len__(self):
+        """
+        Return the number of items in the priority queue.
+        """
+        return len(self._data)
+
+    def add(self, key, value):
+        """
+        Add a key-value pair to the priority queue.
+        When at capacity, return the (k, v) tuple evicted to make room (possibly
+        the new pair itself); otherwise return None.
+        """
+        evicted = None
+        if self._capacity is not None and len(self._data) >= self._capacity:
+            if self._evict == 'min':
+                if not self._data[0]._key < key:
+                    # the newcomer would be the one evicted
+                    return key, value
+                evicted = self.remove_min()
+            else:
+                if not key < self._data[self._max_index()]._key:
+                    return key, value
+                evicted = self.remove_max()
+        self._data.append(self._Item(key, value))
+        self._unheap(len(self._data) - 1)
+        return evicted
+
+    def min(self):
+        """
+        Return but do not remove (k, v) tuple with minimum key.
+        Raise Empty exception if empty.
+        """
+        if self.is_empty():
+            raise Empty('Priority queue is empty.')
+        item = self._data[0]
+        return item._key, item._value
+
+    def max(self):
+        """
+        Return but do not remove (k, v) tuple with maximum key.
+        Raise Empty exception if empty.
+        """
+        if self.is_empty():
+            raise Empty('Priority queue is empty.')
+        item = self._data[self._max_index()]
+        return item._key, item._value
+
+    def remove_min(self):
+        """
+        Remove and return (k, v) tuple with minimum key.
+        Raise Empty exception if empty.
+        """
+        if self.is_empty():
+            raise Empty('Priority queue is empty.')
+        item = self._remove_at(0)
+        return item._key, item._value
+
+    def remove_max(self):
+        """
+        Remove and return (k, v) tuple with maximum key.
+        Raise Empty exception if empty.
+        """
+        if self.is_empty():
+            raise Empty('Priority queue is empty.')
+        item = self._remove_at(self._max_index())
+        return item._key, item._value
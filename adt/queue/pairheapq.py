@@ -0,0 +1,204 @@
+from core.exceptions import Empty
+from core.owner import Owner
+from .proique import PriorityQueueBase
+
+
+class PairingHeapPriorityQueue(PriorityQueueBase):
+    """
+    A locator-based, meldable priority queue implemented with a pairing heap.
+
+    The heap is a multiway tree stored as first-child/next-sibling links.
+    add and meld link two trees in O(1); remove_min pairs up the root's
+    children and folds them together in O(log n) amortized time;
+    decrease_key cuts a subtree and links it to the root, in o(log n)
+    amortized time.
+    """
+
+    class Locator(PriorityQueueBase._Item):
+        """
+        Token for locating an entry of the priority queue.
+        """
+        __slots__ = '_child', '_sibling', '_prev', '_owner'
+
+        def __init__(self, k, v, owner):
+            super().__init__(k, v)
+            # leftmost child
+            self._child = None
+            # next sibling to the right
+            self._sibling = None
+            # left sibling, or parent for a leftmost child
+            self._prev = None
+            self._owner = owner
+
+    # nonpublic behaviors
+    def _validate(self, loc):
+        """
+        Raise ValueError unless loc is a locator of an entry in this queue.
+        """
+        if not isinstance(loc, self.Locator) or loc._owner is None or loc._owner.root() is not self._owner:
+            raise ValueError('Invalid locator')
+
+    @staticmethod
+    def _link(a, b):
+        """
+        Make the root with the larger key the leftmost child of the other; return the new root.
+        """
+        if b._key < a._key:
+            a, b = b, a
+        b._sibling = a._child
+        if a._child is not None:
+            a._child._prev = b
+        a._child = b
+        b._prev = a
+        return a
+
+    @staticmethod
+    def _cut(loc):
+        """
+        Detach the subtree rooted at loc from its parent and siblings.
+        """
+        prev = loc._prev
+        if prev._child is loc:
+            prev._child = loc._sibling
+        else:
+            prev._sibling = loc._sibling
+        if loc._sibling is not None:
+            loc._sibling._prev = prev
+        loc._prev = loc._sibling = None
+
+    def _combine(self, first):
+        """
+        Meld the sibling list starting at first into one tree and return its root (or None).
+        """
+        # first pass: link siblings in pairs, left to right
+        pairs = []
+        node = first
+        while node is not None:
+            a = node
+            b = a._sibling
+            if b is None:
+                a._prev = a._sibling = None
+                pairs.append(a)
+                break
+            node = b._sibling
+            a._prev = a._sibling = b._prev = b._sibling = None
+            pairs.append(self._link(a, b))
+        if not pairs:
+            return None
+        # second pass: fold the pairs together, right to left
+        root = pairs.pop()
+        while pairs:
+            root = self._link(pairs.pop(), root)
+        return root
+
+    def _detach(self, loc):
+        """
+        Retire the removed entry loc and return its (k, v) tuple.
+        """
+        loc._child = loc._prev = loc._sibling = loc._owner = None
+        self._size -= 1
+        return loc._key, loc._value
+
+    # public behaviors
+    def __init__(self):
+        """
+        Create a new empty priority queue.
+        """
+        self._root = None
+        self._size = 0
+        self._owner = Owner()
+
+    def __len__(self):
+        """
+        Return the number of items in the priority queue.
+        """
+        return self._size
+
+    def add(self, key, value):
+        """
+        Add a key-value pair and return a locator for the new entry.
+        """
+        loc = self.Locator(key, value, self._owner)
+        self._root = loc if self._root is None else self._link(self._root, loc)
+        self._size += 1
+        return loc
+
+    def min(self):
+        """
+        Return but do not remove (k, v) tuple with minimum key.
+        Raise Empty exception if empty.
+        """
+        if self.is_empty():
+            raise Empty('Priority queue is empty.')
+        return self._root._key, self._root._value
+
+    def remove_min(self):
+        """
+        Remove and return (k, v) tuple with minimum key.
+        Raise Empty exception if empty.
+        """
+        if self.is_empty():
+            raise Empty('Priority queue is empty.')
+        root = self._root
+        self._root = self._combine(root._child)
+        return self._detach(root)
+
+    def decrease_key(self, loc, newkey):
+        """
+        Lower the key of the entry identified by Locator loc to newkey.
+        """
+        self._validate(loc)
+        if loc._key < newkey:
+            raise ValueError('new key is larger than current key')
+        loc._key = newkey
+        if loc is not self._root:
+            self._cut(loc)
+            self._root = self._link(self._root, loc)
+
+    def update(self, loc, newkey, newval):
+        """
+        Update the key and value for the entry identified by Locator loc.
+        """
+        self._validate(loc)
+        loc._value = newval
+        if not loc._key < newkey:
+            self.decrease_key(loc, newkey)
+            return
+        # a larger key: take loc out, then link it back in alone
+        loc._key = newkey
+        if loc is self._root:
+            children = self._combine(loc._child)
+        else:
+            self._cut(loc)
+            children = self._combine(loc._child)
+            children = self._root if children is None else self._link(self._root, children)
+        loc._child = None
+        self._root = loc if children is None else self._link(children, loc)
+
+    def remove(self, loc):
+        """
+        Remove and return the (k, v) pair identified by Locator loc.
+        """
+        self._validate(loc)
+        if loc is self._root:
+            return self.remove_min()
+        self._cut(loc)
+        children = self._combine(loc._child)
+        if children is not None:
+            self._root = self._link(self._root, children)
+        return self._detach(loc)
+
+    def meld(self, other):
+        """
+        Move all entries of the pairing heap other into this one in O(1), leaving other empty.
+        Locators of other's entries stay valid, now for this queue.
+        """
+        if other is self or other.is_empty():
+            return
+        self._root = other._root if self._root is None else self._link(self._root, other._root)
+        self._size += other._size
+        # other's locators now resolve to this queue; other starts afresh
+        other._owner._parent = self._owner
+        other._owner = Owner()
+        other._root = None
+        other._size = 0
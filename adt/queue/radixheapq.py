@@ -0,0 +1,106 @@
+from core.exceptions import Empty
+from .proique import PriorityQueueBase
+
+
+class RadixHeapPriorityQueue(PriorityQueueBase):
+    """
+    A min-oriented priority queue for monotone integer keys, implemented with a radix heap.
+
+    Keys may never be smaller than the last key removed, nor than start,
+    which may be negative. Keys are kept as offsets from start, so all of
+    them are non-negative: an item at offset k sits in bucket
+    (k ^ last).bit_length(), where last is the offset of the last key
+    removed, so bucket 0 holds the keys equal to it. When it runs dry, the
+    lowest nonempty bucket is emptied into smaller ones around its minimum;
+    an item only ever moves to a smaller bucket, making add O(1) and
+    remove_min O(log C) amortized, for keys spanning a range C.
+    """
+
+    # nonpublic behaviors
+    def _settle(self):
+        """
+        Make bucket 0 nonempty by redistributing the lowest nonempty bucket.
+        """
+        buckets = self._buckets
+        if buckets[0]:
+            return
+        i = 1
+        while not buckets[i]:
+            i += 1
+        items = buckets[i]
+        buckets[i] = []
+        last = min(item[0] for item in items)
+        self._last = last
+        for item in items:
+            buckets[(item[0] ^ last).bit_length()].append(item)
+
+    # public behaviors
+    def __init__(self, start=0):
+        """
+        Create a new empty priority queue accepting integer keys from start upward.
+        """
+        # keys are stored as non-negative offsets from start, for the bit tricks
+        self._start = start
+        # offset of the last item removed, the floor for new keys
+        self._last = 0
+        # bucket j holds items whose offset first differs from last at bit j-1
+        self._buckets = [[]]
+        self._size = 0
+
+    def __len__(self):
+        """
+        Return the number of items in the priority queue.
+        """
+        return self._size
+
+    @property
+    def last(self):
+        """
+        The smallest key that may still be added.
+        """
+        return self._start + self._last
+
+    def add(self, key, value):
+        """
+        Add a key-value pair to the priority queue.
+        Raise ValueError if key is below the last key removed.
+        """
+        offset = key - self._start
+        if offset < self._last:
+            raise ValueError('key {0} is below the last extracted key {1}'.format(key, self.last))
+        j = (offset ^ self._last).bit_length()
+        buckets = self._buckets
+        if j >= len(buckets):
+            buckets.extend([] for _ in range(j + 1 - len(buckets)))
+        buckets[j].append((offset, value))
+        self._size += 1
+
+    def min(self):
+        """
+        Return but do not remove (k, v) tuple with minimum key.
+        Raise Empty exception if empty.
+        """
+        if self.is_empty():
+            raise Empty('Priority queue is empty.')
+        buckets = self._buckets
+        if buckets[0]:
+            offset, value = buckets[0][-1]
+        else:
+            # scan, without settling: that would raise the floor for add
+            i = 1
+            while not buckets[i]:
+                i += 1
+            offset, value = min(buckets[i], key=lambda item: item[0])
+        return self._start + offset, value
+
+    def remove_min(self):
+        """
+        Remove and return (k, v) tuple with minimum key.
+        Raise Empty exception if empty.
+        """
+        if self.is_empty():
+            raise Empty('Priority queue is empty.')
+        self._settle()
+        self._size -= 1
+        offset, value = self._buckets[0].pop()
+        return self._start + offset, value
@@ -0,0 +1,244 @@
+from multiprocessing import shared_memory
+
+from core.exceptions import Empty, Full
+
+
+class SharedRingBuffer:
+    """
+    Single-producer/single-consumer FIFO of byte records in shared memory.
+
+    Indexing follows ArrayQueue: the front of the queue is head % capacity and
+    its size is tail - head. head and tail are ever-increasing byte counters,
+    each written by one side only (head by the consumer, tail by the producer),
+    so the two processes need no lock. Each side publishes its counter only
+    after the record bytes are in place; this relies on aligned 8-byte stores
+    being atomic and kept in order, as on x86-64.
+
+    With record_size, every record is exactly that many bytes. Otherwise
+    records are length-prefixed and padded to 8 bytes, and a record that would
+    straddle the end of the buffer starts over at offset 0 instead, so each
+    record is one contiguous run and can be read through a memoryview. For
+    such a record to fit once the consumer catches up, wherever the tail
+    is, a record with its prefix and padding may take at most half the
+    capacity; larger ones are rejected with ValueError.
+    """
+    _HEADER_SIZE = 128  # head and tail live on separate cache lines
+    _HEAD, _CAPACITY, _RECORD_SIZE, _TAIL = 0, 1, 2, 8  # slots of the 'Q' header view
+    _PREFIX = 8  # length prefix of a variable-size record
+    _WRAP = (1 << 64) - 1  # length marking the unused end of the buffer
+
+    def __init__(self, capacity=1 << 20, record_size=None, name=None, _shm=None):
+        """
+        Create a ring buffer of about capacity bytes in a new shared memory block.
+        Other processes open it with SharedRingBuffer.attach(ring.name).
+        """
+        if _shm is not None:
+            # attaching to an existing block
+            self._shm = _shm
+            self._init_views()
+            return
+        if record_size is not None:
+            if record_size <= 0:
+                raise ValueError('record_size must be positive')
+            # whole records only, so no record straddles the end
+            capacity = max(1, capacity // record_size) * record_size
+        else:
+            capacity = max(4 * self._PREFIX, (capacity + 7) & ~7)
+        self._shm = shared_memory.SharedMemory(name=name, create=True, size=self._HEADER_SIZE + capacity)
+        header = self._shm.buf[:self._HEADER_SIZE].cast('Q')
+        for k in range(len(header)):
+            header[k] = 0
+        header[self._CAPACITY] = capacity
+        header[self._RECORD_SIZE] = record_size or 0
+        header.release()
+        self._init_views()
+
+    @classmethod
+    def attach(cls, name):
+        """
+        Open the ring buffer created (by another process) under name.
+        """
+        return cls(_shm=shared_memory.SharedMemory(name=name))
+
+    def __reduce__(self):
+        # pass rings to worker processes by name
+        return self.attach, (self.name,)
+
+    def _init_views(self):
+        """
+        Map the header counters and the data area of the shared block.
+        """
+        buf = self._shm.buf
+        self._counters = buf[:self._HEADER_SIZE].cast('Q')
+        self._capacity = self._counters[self._CAPACITY]
+        self._record_size = self._counters[self._RECORD_SIZE] or None
+        self._data = buf[self._HEADER_SIZE:self._HEADER_SIZE + self._capacity]
+        # length prefixes, addressed in units of 8 bytes
+        self._words = self._data.cast('Q') if self._record_size is None else None
+
+    @property
+    def name(self):
+        """
+        Name of the shared memory block, for SharedRingBuffer.attach().
+        """
+        return self._shm.name
+
+    def __len__(self):
+        """
+        Return the number of bytes in use (records, prefixes and padding).
+        """
+        return self._counters[self._TAIL] - self._counters[self._HEAD]
+
+    def is_empty(self):
+        """
+        Return True if there is no record to consume.
+        """
+        return self._counters[self._TAIL] == self._counters[self._HEAD]
+
+    # producer side
+    def _space(self, tail, size):
+        """
+        Return the bytes a record of size bytes written at tail takes up,
+        including any skipped end of the buffer.
+        """
+        if self._record_size is not None:
+            if size != self._record_size:
+                raise ValueError('record must be {0} bytes'.format(self._record_size))
+            return size
+        need = self._PREFIX + ((size + 7) & ~7)
+        if need > self._capacity // 2:
+            # a larger record might not fit even in an empty ring, as skipping
+            # the end of the buffer can cost up to capacity - need bytes
+            raise ValueError('record larger than half the ring buffer')
+        room = self._capacity - tail % self._capacity
+        # the record starts over at offset 0 if it does not fit before the end
+        return need if need <= room else room + need
+
+    def _write(self, tail, data):
+        """
+        Store data at position tail and return the position after it.
+        """
+        size = len(data)
+        offset = tail % self._capacity
+        if self._record_size is not None:
+            self._data[offset:offset + size] = data
+            return tail + size
+        need = self._PREFIX + ((size + 7) & ~7)
+        if need > self._capacity - offset:
+            # mark the end as unused and start over at offset 0
+            self._words[offset // 8] = self._WRAP
+            tail += self._capacity - offset
+            offset = 0
+        self._words[offset // 8] = size
+        self._data[offset + self._PREFIX:offset + self._PREFIX + size] = data
+        return tail + need
+
+    def put(self, data):
+        """
+        Publish one record (a bytes-like object).
+        Raise Full exception if there is no room for it.
+        """
+        tail = self._counters[self._TAIL]
+        if self._space(tail, len(data)) > self._capacity - (tail - self._counters[self._HEAD]):
+            raise Full('Ring buffer is full')
+        # publish only once the record is in place
+        self._counters[self._TAIL] = self._write(tail, data)
+
+    def put_many(self, records):
+        """
+        Publish records in order, as many as fit, with a single update of tail.
+        Return the number of records published.
+        """
+        tail = self._counters[self._TAIL]
+        free = self._capacity - (tail - self._counters[self._HEAD])
+        count = 0
+        for data in records:
+            need = self._space(tail, len(data))
+            if need > free:
+                break
+            tail = self._write(tail, data)
+            free -= need
+            count += 1
+        self._counters[self._TAIL] = tail
+        return count
+
+    # consumer side
+    def _locate(self, head):
+        """
+        Return (offset, size, next head) of the record at position head.
+        """
+        offset = head % self._capacity
+        if self._record_size is not None:
+            return offset, self._record_size, head + self._record_size
+        size = self._words[offset // 8]
+        if size == self._WRAP:
+            head += self._capacity - offset
+            offset = 0
+            size = self._words[0]
+        return offset + self._PREFIX, size, head + self._PREFIX + ((size + 7) & ~7)
+
+    def peek_many(self, max_n):
+        """
+        Return zero-copy memoryviews of up to max_n records, without consuming them.
+        A view stays valid until the records are released with release().
+        """
+        head = self._counters[self._HEAD]
+        tail = self._counters[self._TAIL]
+        views = []
+        while head != tail and len(views) < max_n:
+            offset, size, head = self._locate(head)
+            views.append(self._data[offset:offset + size])
+        return views
+
+    def release(self, n):
+        """
+        Consume the next n records (as returned by peek_many), freeing their space.
+        """
+        head = self._counters[self._HEAD]
+        tail = self._counters[self._TAIL]
+        for _ in range(n):
+            if head == tail:
+                raise Empty('Ring buffer is empty')
+            head = self._locate(head)[2]
+        self._counters[self._HEAD] = head
+
+    def get(self):
+        """
+        Remove and return the next record as bytes.
+        Raise Empty exception if there is none.
+        """
+        head = self._counters[self._HEAD]
+        if head == self._counters[self._TAIL]:
+            raise Empty('Ring buffer is empty')
+        offset, size, head = self._locate(head)
+        answer = bytes(self._data[offset:offset + size])
+        self._counters[self._HEAD] = head
+        return answer
+
+    def get_many(self, max_n):
+        """
+        Remove and return up to max_n records as a list of bytes.
+        """
+        head = self._counters[self._HEAD]
+        tail = self._counters[self._TAIL]
+        answer = []
+        while head != tail and len(answer) < max_n:
+            offset, size, head = self._locate(head)
+            answer.append(bytes(self._data[offset:offset + size]))
+        self._counters[self._HEAD] = head
+        return answer
+
+    def close(self):
+        """
+        Detach from the shared memory; views from peek_many must be released first.
+        """
+        for view in (self._words, self._data, self._counters):
+            if view is not None:
+                view.release()
+        self._shm.close()
+
+    def unlink(self):
+        """
+        Destroy the shared memory block (call once, from the creating process).
+        """
+        self._shm.unlink()
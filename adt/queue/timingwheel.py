@@ -0,0 +1,190 @@
+import math
+
+from .deque import LinkedDeque
+
+
+class _Slot(LinkedDeque):
+    """
+    Nonpublic bucket of a timing wheel: a LinkedDeque that hands out its
+    nodes, so a timer can be unlinked from the middle in O(1).
+    """
+
+    def append(self, timer):
+        """
+        Add timer at the back and return its node.
+        """
+        return self._insert_between(timer, self._trailer._prev, self._trailer)
+
+    def unlink(self, node):
+        """
+        Remove the node returned by append.
+        """
+        self._delete_node(node)
+
+
+class TimingWheel:
+    """
+    Timer scheduler implemented with a hierarchical timing wheel.
+
+    Time advances in integer ticks. Level L is a circular array of slots
+    buckets, each spanning slots**L ticks, so the wheel covers slots**levels
+    ticks ahead; timers further out wait in the top level and are placed
+    again when it comes around. When a level completes a turn, the next
+    slot of the level above is cascaded: its timers move down to finer
+    slots. schedule and cancel take O(1) time; each timer cascades at most
+    once per level.
+    """
+
+    class Timer:
+        """
+        Handle for a scheduled callback, accepted by cancel.
+        """
+        __slots__ = '_deadline', '_callback', '_slot', '_node'
+
+        def __init__(self, deadline, callback):
+            self._deadline = deadline
+            self._callback = callback
+            # bucket holding the timer and its node there (None once fired or cancelled)
+            self._slot = None
+            self._node = None
+
+        @property
+        def deadline(self):
+            """
+            Tick at which the callback runs.
+            """
+            return self._deadline
+
+        def is_pending(self):
+            """
+            Return True if the timer has neither fired nor been cancelled.
+            """
+            return self._slot is not None
+
+    # nonpublic behaviors
+    def _place(self, timer):
+        """
+        Put timer in the finest slot whose turn comes no later than its deadline.
+        """
+        diff = timer._deadline - self._now
+        width = 1
+        for level in self._wheels:
+            if diff < width * self._slots:
+                slot = level[(timer._deadline // width) % self._slots]
+                break
+            width *= self._slots
+        else:
+            # beyond the top level: wait in the slot cascaded a full turn from now
+            width //= self._slots
+            slot = self._wheels[-1][(self._now // width) % self._slots]
+        timer._slot = slot
+        timer._node = slot.append(timer)
+
+    # public behaviors
+    def __init__(self, slots=256, levels=4, start=0):
+        """
+        Create an empty timing wheel of the given shape, at tick start.
+        """
+        if slots < 2 or levels < 1:
+            raise ValueError('a wheel needs at least 2 slots and 1 level')
+        self._slots = slots
+        self._wheels = [[_Slot() for _ in range(slots)] for _ in range(levels)]
+        # current tick
+        self._now = start
+        # number of pending timers
+        self._size = 0
+
+    def __len__(self):
+        """
+        Return the number of pending timers.
+        """
+        return self._size
+
+    def is_empty(self):
+        """
+        Return True if no timer is pending.
+        """
+        return self._size == 0
+
+    @property
+    def now(self):
+        """
+        Current tick.
+        """
+        return self._now
+
+    def schedule(self, delay, callback):
+        """
+        Run callback() delay ticks from now (at the next tick if delay < 1).
+        A fractional delay is rounded up to whole ticks, so a timer never fires early.
+        Return a Timer handle for cancel.
+        """
+        timer = self.Timer(self._now + max(math.ceil(delay), 1), callback)
+        self._place(timer)
+        self._size += 1
+        return timer
+
+    def cancel(self, timer):
+        """
+        Cancel a pending timer; return False if it had already fired or been cancelled.
+        """
+        if timer._slot is None:
+            return False
+        timer._slot.unlink(timer._node)
+        timer._slot = timer._node = None
+        self._size -= 1
+        return True
+
+    def tick(self):
+        """
+        Advance one tick and run the callbacks due. Return the number run.
+        """
+        self._now += 1
+        now = self._now
+        slots = self._slots
+        # upper levels whose lower level has just completed a turn
+        due = 0
+        width = slots
+        while due + 1 < len(self._wheels) and now % width == 0:
+            due += 1
+            width *= slots
+        # cascade them from the top, so timers can fall through several levels
+        for level in range(due, 0, -1):
+            width //= slots
+            slot = self._wheels[level][(now // width) % slots]
+            # empty the slot first: far timers may go back into it
+            timers = [slot.delete_first() for _ in range(len(slot))]
+            for timer in timers:
+                self._place(timer)
+        slot = self._wheels[0][now % slots]
+        # one at a time, as a callback may cancel timers still in the slot
+        later = _Slot()
+        fired = 0
+        while not slot.is_empty():
+            timer = slot.delete_first()
+            if timer._deadline > now:
+                # only in a one-level wheel: a far timer comes round again
+                timer._slot = later
+                timer._node = later.append(timer)
+                continue
+            timer._slot = timer._node = None
+            self._size -= 1
+            fired += 1
+            timer._callback()
+        while not later.is_empty():
+            self._place(later.delete_first())
+        return fired
+
+    def advance(self, now):
+        """
+        Tick until the current tick reaches now, running the callbacks due.
+        Return the number run.
+        """
+        fired = 0
+        while self._now < now:
+            if self._size == 0:
+                # nothing can fire: jump straight there
+                self._now = now
+                break
+            fired += self.tick()
+        return fired
@@ -0,0 +1,208 @@
+from core.exceptions import Empty
+
+
+class _Block:
+    """
+    Lightweight, nonpublic class for storing a block of deque elements.
+    """
+    # streamline memory usage
+    __slots__ = '_data', '_prev', '_next'
+
+    def __init__(self, prev, next):
+        # fixed-size list of element slots
+        self._data = [None] * UnrolledDeque.BLOCK_SIZE
+        # previous block reference
+        self._prev = prev
+        # next block reference
+        self._next = next
+
+
+class UnrolledDeque:
+    """
+    Double-ended queue implementation based on a doubly linked list of
+    fixed-size blocks, as in CPython's collections.deque.
+
+    The elements run from slot left_index of the leftmost block to slot
+    right_index of the rightmost one; blocks in between are full. A node is
+    allocated once per BLOCK_SIZE inserts, instead of once per element.
+    """
+    BLOCK_SIZE = 64  # element slots per block
+
+    def __init__(self):
+        """
+        Create an empty deque.
+        """
+        block = _Block(None, None)
+        self._left = self._right = block
+        # start in the middle so both ends can grow before a new block is needed
+        self._left_index = UnrolledDeque.BLOCK_SIZE // 2
+        self._right_index = self._left_index - 1
+        # number of elements
+        self._size = 0
+
+    def __len__(self):
+        """
+        Return the number of elements in the deque.
+        """
+        return self._size
+
+    def is_empty(self):
+        """
+        Return True if the deque is empty.
+        """
+        return self._size == 0
+
+    def first(self):
+        """
+        Return (but do not remove) the element at the front of the deque.
+        """
+        if self.is_empty():
+            raise Empty('Deque is empty')
+        return self._left._data[self._left_index]
+
+    def last(self):
+        """
+        Return (but do not remove) the element at the back of the deque.
+        """
+        if self.is_empty():
+            raise Empty('Deque is empty')
+        return self._right._data[self._right_index]
+
+    def insert_first(self, e):
+        """
+        Add an element to the front of the deque.
+        """
+        if self._left_index == 0:
+            # leftmost block is full, link a new one before it
+            block = _Block(None, self._left)
+            self._left._prev = block
+            self._left = block
+            self._left_index = UnrolledDeque.BLOCK_SIZE
+        self._left_index -= 1
+        self._left._data[self._left_index] = e
+        self._size += 1
+
+    def insert_last(self, e):
+        """
+        Add an element to the back of the deque.
+        """
+        if self._right_index == UnrolledDeque.BLOCK_SIZE - 1:
+            # rightmost block is full, link a new one after it
+            block = _Block(self._right, None)
+            self._right._next = block
+            self._right = block
+            self._right_index = -1
+        self._right_index += 1
+        self._right._data[self._right_index] = e
+        self._size += 1
+
+    def delete_first(self):
+        """
+        Remove and return the element from the front of the deque.
+        Raise Empty exception if the deque is empty.
+        """
+        if self.is_empty():
+            raise Empty('Deque is empty')
+        answer = self._left._data[self._left_index]
+        self._left._data[self._left_index] = None  # help garbage collection
+        self._left_index += 1
+        self._size -= 1
+        if self._size == 0:
+            self._recenter()
+        elif self._left_index == UnrolledDeque.BLOCK_SIZE:
+            # leftmost block emptied, drop it
+            self._left = self._left._next
+            self._left._prev = None
+            self._left_index = 0
+        return answer
+
+    def delete_last(self):
+        """
+        Remove and return the element from the back of the deque.
+        Raise Empty exception if the deque is empty.
+        """
+        if self.is_empty():
+            raise Empty('Deque is empty')
+        answer = self._right._data[self._right_index]
+        self._right._data[self._right_index] = None  # help garbage collection
+        self._right_index -= 1
+        self._size -= 1
+        if self._size == 0:
+            self._recenter()
+        elif self._right_index < 0:
+            # rightmost block emptied, drop it
+            self._right = self._right._prev
+            self._right._next = None
+            self._right_index = UnrolledDeque.BLOCK_SIZE - 1
+        return answer
+
+    def _recenter(self):
+        """
+        Reset the indices of an empty deque to the middle of its only block.
+        """
+        self._left_index = UnrolledDeque.BLOCK_SIZE // 2
+        self._right_index = self._left_index - 1
+
+    def _locate(self, k):
+        """
+        Return (block, slot) of the element at position k, walking from the nearer end.
+        """
+        if not 0 <= k < self._size:
+            raise IndexError('invalid index')
+        if k < self._size // 2:
+            block = self._left
+            k += self._left_index
+            while k >= UnrolledDeque.BLOCK_SIZE:
+                block = block._next
+                k -= UnrolledDeque.BLOCK_SIZE
+        else:
+            block = self._right
+            k = self._right_index - (self._size - 1 - k)
+            while k < 0:
+                block = block._prev
+                k += UnrolledDeque.BLOCK_SIZE
+        return block, k
+
+    def __getitem__(self, k):
+        """
+        Return the element at position k (0 is the front), in O(n/BLOCK_SIZE) time.
+        """
+        block, j = self._locate(k)
+        return block._data[j]
+
+    def __setitem__(self, k, e):
+        """
+        Replace the element at position k (0 is the front), in O(n/BLOCK_SIZE) time.
+        """
+        block, j = self._locate(k)
+        block._data[j] = e
+
+    def __iter__(self):
+        """
+        Generate the elements from front to back.
+        """
+        block = self._left
+        start = self._left_index
+        left = self._size
+        while left > 0:
+            stop = min(UnrolledDeque.BLOCK_SIZE, start + left)
+            for j in range(start, stop):
+                yield block._data[j]
+            left -= stop - start
+            block = block._next
+            start = 0
+
+    def rotate(self, r=1):
+        """
+        Rotate the deque r steps to the right (to the left if r is negative).
+        """
+        if self._size <= 1:
+            return
+        r %= self._size
+        # move whichever side is shorter
+        if r <= self._size // 2:
+            for _ in range(r):
+                self.insert_first(self.delete_last())
+        else:
+            for _ in range(self._size - r):
+                self.insert_last(self.delete_first())
@@ -21,10 +21,12 @@ class LinkedStack:
             self._next = next
 
     # stack methods
-    def __init__(self):
+    def __init__(self, pool=None):
         """
         Create an empty stack.
+        Nodes are recycled through pool (a SinglyNodePool) if one is given.
         """
+        self._pool = pool
         # reference to the head node
         self._head = None
         # number of the stack elements
@@ -47,7 +49,10 @@ class LinkedStack:
         Add element e to the top of the stack.
         """
         # create and link a new node
-        self._head = self._Node(e, self._head)
+        if self._pool is None:
+            self._head = self._Node(e, self._head)
+        else:
+            self._head = self._pool.acquire(e, self._head)
         self._size += 1
 
     def top(self):
@@ -67,8 +72,11 @@ class LinkedStack:
         """
         if self.is_empty():
             raise Empty('Stack is empty')
-        answer = self._head._element
+        oldhead = self._head
+        answer = oldhead._element
         # bypass the former top node
-        self._head = self._head._next
+        self._head = oldhead._next
+        if self._pool is not None:
+            self._pool.release(oldhead)
         self._size -= 1
         return answer
@@ -0,0 +1,79 @@
+"""
+Contention benchmark: BlockingQueue against the standard library's queue.Queue.
+
+    python benchmark/bench_blockque.py [items]
+
+For 1, 2, 4, 8 and 16 producer threads (with as many consumers), `items`
+integers are passed through a queue bounded at 1024, item by item and, for
+BlockingQueue, also in put_many/get_many batches of BATCH.
+"""
+import os
+import sys
+import threading
+import time
+
+import queue as std_queue
+
+# adt/queue shadows the stdlib module from here on
+del sys.modules['queue']
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'adt'))
+
+from queue import BlockingQueue  # noqa: E402
+
+BATCH = 64
+MAXSIZE = 1024
+
+
+def single(q, threads, items):
+    per = items // threads
+
+    def produce():
+        for k in range(per):
+            q.put(k)
+
+    def consume():
+        for _ in range(per):
+            q.get()
+
+    return run(produce, consume, threads)
+
+
+def batched(q, threads, items):
+    per = items // threads
+
+    def produce():
+        chunk = list(range(BATCH))
+        for _ in range(per // BATCH):
+            q.put_many(chunk)
+
+    def consume():
+        left = (per // BATCH) * BATCH
+        while left:
+            left -= len(q.get_many(min(BATCH, left)))
+
+    return run(produce, consume, threads)
+
+
+def run(produce, consume, threads):
+    workers = [threading.Thread(target=produce) for _ in range(threads)]
+    workers += [threading.Thread(target=consume) for _ in range(threads)]
+    start = time.perf_counter()
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    return time.perf_counter() - start
+
+
+def main():
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    print('{0:>8} {1:>16} {2:>16} {3:>16}'.format('threads', 'queue.Queue/s', 'Blocking/s', 'Blocking batch/s'))
+    for threads in (1, 2, 4, 8, 16):
+        std = single(std_queue.Queue(MAXSIZE), threads, items)
+        ours = single(BlockingQueue(MAXSIZE), threads, items)
+        batch = batched(BlockingQueue(MAXSIZE), threads, items)
+        print('{0:>8} {1:>16,.0f} {2:>16,.0f} {3:>16,.0f}'.format(threads, items / std, items / ours, items / batch))
+
+
+if __name__ == '__main__':
+    main()
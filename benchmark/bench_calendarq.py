@@ -0,0 +1,41 @@
+"""
+Hold-model benchmark of CalendarQueue against HeapPriorityQueue.
+
+    python benchmark/bench_calendarq.py [holds]
+
+A queue of n events is built, then each hold removes the earliest event,
+at time t, and schedules a new one at t plus an exponential increment, as
+a discrete-event simulator does. Times are per hold, for several n.
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'adt'))
+
+from queue import CalendarQueue, HeapPriorityQueue  # noqa: E402  (adt/queue, not the stdlib module)
+
+
+def hold(pq, n, holds):
+    rand = random.Random(1)
+    for _ in range(n):
+        pq.add(rand.expovariate(1.0), None)
+    increments = [rand.expovariate(1.0) for _ in range(holds)]
+    start = time.perf_counter()
+    for inc in increments:
+        t, value = pq.remove_min()
+        pq.add(t + inc, value)
+    return (time.perf_counter() - start) / holds * 1e6
+
+
+def main():
+    holds = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    print('{0:>10} {1:>22} {2:>22}'.format('n', 'HeapPriorityQueue us', 'CalendarQueue us'))
+    for n in (100, 1000, 10000, 100000, 1000000):
+        print('{0:>10} {1:>22.3f} {2:>22.3f}'.format(n, hold(HeapPriorityQueue(), n, holds),
+                                                     hold(CalendarQueue(), n, holds)))
+
+
+if __name__ == '__main__':
+    main()
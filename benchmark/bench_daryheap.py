@@ -0,0 +1,42 @@
+"""
+DaryHeapPriorityQueue at arities 2, 4 and 8, with object and native float
+keys, against the binary HeapPriorityQueue.
+
+    python benchmark/bench_daryheap.py [n]
+
+Each queue gets n adds of random keys, then is drained by n remove_min calls.
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'adt'))
+
+from queue import DaryHeapPriorityQueue, HeapPriorityQueue  # noqa: E402  (adt/queue, not the stdlib module)
+
+
+def run(pq, keys):
+    start = time.perf_counter()
+    for k in keys:
+        pq.add(k, None)
+    middle = time.perf_counter()
+    while not pq.is_empty():
+        pq.remove_min()
+    return middle - start, time.perf_counter() - middle
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    random.seed(1)
+    keys = [random.random() for _ in range(n)]
+    print('{0:>28} {1:>10} {2:>14}'.format('queue', 'add s', 'remove_min s'))
+    print('{0:>28} {1:>10.3f} {2:>14.3f}'.format('HeapPriorityQueue', *run(HeapPriorityQueue(), keys)))
+    for typecode in (None, 'd'):
+        for arity in (2, 4, 8):
+            name = 'DaryHeap(d={0}, {1})'.format(arity, typecode or 'object')
+            print('{0:>28} {1:>10.3f} {2:>14.3f}'.format(name, *run(DaryHeapPriorityQueue(arity, typecode), keys)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""
+Memory and time of ArrayDeque and UnrolledDeque against LinkedDeque.
+
+    python benchmark/bench_deque.py [n]
+
+Memory is what tracemalloc sees allocated while holding n references to
+one shared object, i.e. the container overhead alone; time covers n
+insert_last calls followed by n delete_first calls. The gc column counts
+generation-0 collections triggered during the timed run.
+"""
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'adt'))
+
+from queue import ArrayDeque, LinkedDeque, UnrolledDeque  # noqa: E402  (adt/queue, not the stdlib module)
+
+
+def memory(cls, n):
+    tracemalloc.start()
+    d = cls()
+    element = object()
+    for _ in range(n):
+        d.insert_last(element)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size
+
+
+def churn(cls, n):
+    before = gc.get_stats()[0]['collections']
+    start = time.perf_counter()
+    d = cls()
+    for k in range(n):
+        d.insert_last(k)
+    for _ in range(n):
+        d.delete_first()
+    elapsed = time.perf_counter() - start
+    return elapsed, gc.get_stats()[0]['collections'] - before
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    print('{0:>14} {1:>14} {2:>10} {3:>8}'.format('deque', 'bytes/element', 'time s', 'gc'))
+    for cls in (ArrayDeque, UnrolledDeque, LinkedDeque):
+        size = memory(cls, n)
+        elapsed, collections = churn(cls, n)
+        print('{0:>14} {1:>14.1f} {2:>10.3f} {3:>8}'.format(cls.__name__, size / n, elapsed, collections))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""
+Per-element cost of DynamicArray bulk operations.
+
+    python benchmark/bench_dynarray.py [max_exponent]
+
+For each size n = 10^3 ... 10^max_exponent (default 7) the array is built
+with extend(), then a fixed number of inserts and pops at the middle are
+timed; the shifted-element cost is total time / elements moved.
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'adt'))
+
+from array import DynamicArray  # noqa: E402  (adt/array, not the stdlib module)
+
+OPS = 20
+
+
+def bench(n, typecode):
+    a = DynamicArray(typecode)
+    start = time.perf_counter()
+    a.extend(range(n))
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(OPS):
+        a.insert(n // 2, 0)
+    for _ in range(OPS):
+        a.pop(n // 2)
+    shift = time.perf_counter() - start
+    # every insert/pop moves about n/2 elements
+    moved = 2 * OPS * (n // 2)
+
+    start = time.perf_counter()
+    a.delete_slice(0, n // 2)
+    delete = time.perf_counter() - start
+    return build / n, shift / moved, delete / (n - n // 2)
+
+
+def main():
+    top = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+    print('{0:>10} {1:>6} {2:>14} {3:>14} {4:>16}'.format('n', 'type', 'extend ns/el', 'shift ns/el', 'delete ns/el'))
+    for e in range(3, top + 1):
+        n = 10 ** e
+        for typecode in (None, 'q', 'd'):
+            build, shift, delete = bench(n, typecode)
+            print('{0:>10} {1:>6} {2:>14.2f} {3:>14.3f} {4:>16.3f}'.format(
+                n, typecode or 'object', build * 1e9, shift * 1e9, delete * 1e9))
+
+
+if __name__ == '__main__':
+    main()
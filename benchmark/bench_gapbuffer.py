@@ -0,0 +1,82 @@
+"""
+GapBuffer against DynamicArray on editor-style edit traces.
+
+    python benchmark/bench_gapbuffer.py [size] [edits]
+
+A trace starts from a buffer of `size` elements and performs `edits`
+operations around a cursor: mostly typing (insert at the cursor) and
+backspacing (delete before it), with occasional short cursor moves and rare
+jumps to a random position. GapBuffer pays |jump| element moves per cursor
+move and O(1) per edit; DynamicArray pays n - k element moves per edit.
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'adt'))
+
+from array import DynamicArray, GapBuffer  # noqa: E402  (adt/array, not the stdlib module)
+
+
+def make_trace(size, edits, jump_rate, seed=0):
+    rnd = random.Random(seed)
+    trace = []
+    n = size
+    cursor = size // 2
+    for _ in range(edits):
+        r = rnd.random()
+        if r < jump_rate:
+            cursor = rnd.randrange(n + 1)
+        elif r < 0.1:
+            cursor = min(n, max(0, cursor + rnd.randint(-20, 20)))
+        if r < 0.75 or cursor == 0:
+            trace.append(('insert', cursor))
+            cursor += 1
+            n += 1
+        else:
+            cursor -= 1
+            trace.append(('delete', cursor))
+            n -= 1
+    return trace
+
+
+def run(seq, trace):
+    start = time.perf_counter()
+    for op, k in trace:
+        if op == 'insert':
+            seq.insert(k, 'x')
+        else:
+            seq.pop(k)
+    return time.perf_counter() - start
+
+
+def moved_by_gap(size, trace):
+    """
+    Cost model: elements moved by the gap buffer over the trace.
+    """
+    cursor = size // 2
+    moved = 0
+    for op, k in trace:
+        moved += abs(k - cursor)
+        cursor = k + 1 if op == 'insert' else k
+    return moved
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    edits = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+    print('{0:>10} {1:>14} {2:>14} {3:>16}'.format('jump rate', 'GapBuffer s', 'DynamicArray s', 'gap moves/edit'))
+    for jump_rate in (0.0, 0.001, 0.01, 0.05):
+        trace = make_trace(size, edits, jump_rate)
+        gap = GapBuffer()
+        dyn = DynamicArray()
+        for seq in (gap, dyn):
+            for _ in range(size):
+                seq.append('x')
+        print('{0:>10} {1:>14.3f} {2:>14.3f} {3:>16.1f}'.format(
+            jump_rate, run(gap, trace), run(dyn, trace), moved_by_gap(size, trace) / edits))
+
+
+if __name__ == '__main__':
+    main()
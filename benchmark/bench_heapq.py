@@ -0,0 +1,54 @@
+"""
+Bulk loading a HeapPriorityQueue: n calls to add against from_items.
+
+    python benchmark/bench_heapq.py [n]
+
+Keys come in random order and in descending order, the worst case for add.
+Also times draining the loaded queue with remove_min and a run of pushpop
+calls, both of which use the iterative sift loops.
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'adt'))
+
+from queue import HeapPriorityQueue  # noqa: E402  (adt/queue, not the stdlib module)
+
+
+def report(order, operation, start):
+    print('{0:>10} {1:>12} {2:>8.3f} s'.format(order, operation, time.perf_counter() - start))
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    random.seed(1)
+    keys = {'random': [random.random() for _ in range(n)],
+            'descending': [float(n - k) for k in range(n)]}
+    for order, ks in keys.items():
+        items = [(key, k) for k, key in enumerate(ks)]
+
+        start = time.perf_counter()
+        pq = HeapPriorityQueue()
+        for key, value in items:
+            pq.add(key, value)
+        report(order, 'add x n', start)
+
+        start = time.perf_counter()
+        pq = HeapPriorityQueue.from_items(items)
+        report(order, 'from_items', start)
+
+    start = time.perf_counter()
+    for key, value in items[:n // 10]:
+        pq.pushpop(key + 0.5, value)
+    report('descending', 'pushpop n/10', start)
+
+    start = time.perf_counter()
+    while not pq.is_empty():
+        pq.remove_min()
+    report('descending', 'remove_min', start)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""
+top_k, bottom_k and merge_sorted against heapq.nlargest, nsmallest and merge.
+
+    python benchmark/bench_heapstream.py [n] [k] [inputs]
+
+Selection runs over a stream of n random floats; the merge combines
+`inputs` sorted runs totalling n elements.
+"""
+import heapq
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'adt'))
+
+from queue import bottom_k, merge_sorted, top_k  # noqa: E402  (adt/queue, not the stdlib module)
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    k = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    inputs = int(sys.argv[3]) if len(sys.argv) > 3 else 64
+    random.seed(1)
+    data = [random.random() for _ in range(n)]
+    runs = [sorted(data[j::inputs]) for j in range(inputs)]
+    cases = (('top_k', lambda: top_k(iter(data), k), lambda: heapq.nlargest(k, iter(data))),
+             ('bottom_k', lambda: bottom_k(iter(data), k), lambda: heapq.nsmallest(k, iter(data))),
+             ('merge_sorted', lambda: sum(1 for _ in merge_sorted(*runs)), lambda: sum(1 for _ in heapq.merge(*runs))))
+    print('{0:>14} {1:>10} {2:>10}'.format('operation', 'package s', 'heapq s'))
+    for name, ours, stdlib in cases:
+        print('{0:>14} {1:>10.3f} {2:>10.3f}'.format(name, timed(ours), timed(stdlib)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""
+IndexedPriorityQueue churn in eager and lazy-deletion mode.
+
+    python benchmark/bench_indexprioque.py [timers] [operations]
+
+The queue holds `timers` ids; each operation cancels one (discard) and
+reprioritizes another (upsert), with a remove_min every tenth operation,
+the pattern of a busy timer service.
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'adt'))
+
+from queue import IndexedPriorityQueue  # noqa: E402  (adt/queue, not the stdlib module)
+
+
+def churn(pq, timers, operations):
+    rand = random.Random(1)
+    for k in range(timers):
+        pq.upsert(k, rand.random())
+    start = time.perf_counter()
+    for k in range(operations):
+        pq.discard(rand.randrange(timers))
+        pq.upsert(rand.randrange(timers), rand.random())
+        if k % 10 == 0 and not pq.is_empty():
+            pq.remove_min()
+    return time.perf_counter() - start
+
+
+def main():
+    timers = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    operations = int(sys.argv[2]) if len(sys.argv) > 2 else 300000
+    print('{0:>22} {1:>10}'.format('mode', 'time s'))
+    for name, pq in (('eager', IndexedPriorityQueue()),
+                     ('lazy, threshold 0.25', IndexedPriorityQueue(lazy=True, threshold=0.25)),
+                     ('lazy, threshold 0.5', IndexedPriorityQueue(lazy=True, threshold=0.5))):
+        print('{0:>22} {1:>10.3f}'.format(name, churn(pq, timers, operations)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""
+Steady-state LinkedQueue and LinkedDeque churn with and without node pooling.
+
+    python benchmark/bench_nodepool.py [operations] [backlog]
+
+The queues first fill to `backlog` elements, then alternate one insert and
+one delete `operations` times, the pattern where node recycling pays off.
+"""
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'adt'))
+
+from linkedlist import DoublyNodePool, SinglyNodePool  # noqa: E402
+from queue import LinkedDeque, LinkedQueue  # noqa: E402  (adt/queue, not the stdlib module)
+
+
+def churn(insert, delete, operations, backlog):
+    for k in range(backlog):
+        insert(k)
+    before = gc.get_stats()[0]['collections']
+    start = time.perf_counter()
+    for k in range(operations):
+        insert(k)
+        delete()
+    return time.perf_counter() - start, gc.get_stats()[0]['collections'] - before
+
+
+def main():
+    operations = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    backlog = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    print('{0:>24} {1:>10} {2:>8} {3:>10}'.format('container', 'time s', 'gc', 'hit rate'))
+    cases = (('LinkedQueue', lambda pool: LinkedQueue(pool), SinglyNodePool, 'enqueue', 'dequeue'),
+             ('LinkedDeque', lambda pool: LinkedDeque(pool), DoublyNodePool, 'insert_last', 'delete_first'))
+    for name, make, pool_type, insert, delete in cases:
+        for pool in (None, pool_type()):
+            q = make(pool)
+            elapsed, collections = churn(getattr(q, insert), getattr(q, delete), operations, backlog)
+            label = name + (' + pool' if pool is not None else '')
+            rate = '{0:.3f}'.format(pool.hit_rate()) if pool is not None else '-'
+            print('{0:>24} {1:>10.3f} {2:>8} {3:>10}'.format(label, elapsed, collections, rate))
+
+
+if __name__ == '__main__':
+    main()
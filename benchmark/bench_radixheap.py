@@ -0,0 +1,43 @@
+"""
+RadixHeapPriorityQueue against HeapPriorityQueue on a monotone workload.
+
+    python benchmark/bench_radixheap.py [n] [span]
+
+Like Dijkstra's algorithm with integer weights, every step removes the
+minimum and adds keys up to `span` above it; the queue starts with n keys.
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'adt'))
+
+from queue import HeapPriorityQueue, RadixHeapPriorityQueue  # noqa: E402  (adt/queue, not the stdlib module)
+
+
+def run(pq, n, span):
+    rand = random.Random(1)
+    for _ in range(n):
+        pq.add(rand.randrange(span), None)
+    start = time.perf_counter()
+    for _ in range(n):
+        key, _ = pq.remove_min()
+        pq.add(key + rand.randrange(span), None)
+        pq.add(key + rand.randrange(span), None)
+        pq.remove_min()
+    while not pq.is_empty():
+        pq.remove_min()
+    return time.perf_counter() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    span = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    print('{0:>24} {1:>10}'.format('queue', 'time s'))
+    for name, make in (('HeapPriorityQueue', HeapPriorityQueue), ('RadixHeapPriorityQueue', RadixHeapPriorityQueue)):
+        print('{0:>24} {1:>10.3f}'.format(name, run(make(), n, span)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""
+Cross-process throughput of SharedRingBuffer against multiprocessing.Queue.
+
+    python benchmark/bench_shmring.py [records] [record_bytes]
+
+A child process produces `records` byte strings of `record_bytes` bytes and
+the parent consumes them. The ring is driven in batches of BATCH records;
+multiprocessing.Queue pickles and pipes every item.
+"""
+import multiprocessing
+import multiprocessing.queues  # binds the stdlib queue module before adt/queue shadows it
+import os
+import sys
+import time
+
+# adt/queue takes the place of the stdlib module from here on
+del sys.modules['queue']
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'adt'))
+
+from queue.shmring import SharedRingBuffer  # noqa: E402
+
+BATCH = 256
+
+
+def ring_producer(ring, records, payload):
+    batch = [payload] * BATCH
+    sent = 0
+    while sent < records:
+        n = ring.put_many(batch[:min(BATCH, records - sent)])
+        if n == 0:
+            time.sleep(0)
+        sent += n
+    ring.close()
+
+
+def queue_producer(q, records, payload):
+    for _ in range(records):
+        q.put(payload)
+
+
+def bench_ring(records, payload, record_size):
+    ring = SharedRingBuffer(capacity=1 << 22, record_size=record_size)
+    start = time.perf_counter()
+    child = multiprocessing.Process(target=ring_producer, args=(ring, records, payload))
+    child.start()
+    got = 0
+    while got < records:
+        views = ring.peek_many(BATCH)
+        if not views:
+            time.sleep(0)
+            continue
+        for view in views:
+            view.release()
+        ring.release(len(views))
+        got += len(views)
+    elapsed = time.perf_counter() - start
+    child.join()
+    ring.close()
+    ring.unlink()
+    return elapsed
+
+
+def bench_queue(records, payload):
+    q = multiprocessing.Queue(maxsize=1 << 16)
+    start = time.perf_counter()
+    child = multiprocessing.Process(target=queue_producer, args=(q, records, payload))
+    child.start()
+    for _ in range(records):
+        q.get()
+    elapsed = time.perf_counter() - start
+    child.join()
+    return elapsed
+
+
+def main():
+    records = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+    payload = os.urandom(size)
+    print('{0:>32} {1:>14}'.format('transport', 'records/s'))
+    for label, elapsed in (('SharedRingBuffer (fixed size)', bench_ring(records, payload, size)),
+                           ('SharedRingBuffer (prefixed)', bench_ring(records, payload, None)),
+                           ('multiprocessing.Queue', bench_queue(records, payload))):
+        print('{0:>32} {1:>14,.0f}'.format(label, records / elapsed))
+
+
+if __name__ == '__main__':
+    main()
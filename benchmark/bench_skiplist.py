@@ -0,0 +1,54 @@
+"""
+SkipListMap against SortedTableMap and AVLTreeMap.
+
+    python benchmark/bench_skiplist.py [n]
+
+Each map is filled with n random keys, searched in random order and in
+ascending order (where the skip list's finger search helps), queried with
+find_ge, and emptied again in random order.
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'adt'))
+
+from map import SkipListMap, SortedTableMap  # noqa: E402
+from tree import AVLTreeMap  # noqa: E402
+
+
+def timed(fn, keys):
+    start = time.perf_counter()
+    for k in keys:
+        fn(k)
+    return time.perf_counter() - start
+
+
+def run(make, keys, ordered):
+    m = make()
+
+    def insert(k):
+        m[k] = k
+
+    elapsed = [timed(insert, keys),
+               timed(m.__getitem__, keys),
+               timed(m.__getitem__, ordered),
+               timed(m.find_ge, keys),
+               timed(m.__delitem__, keys)]
+    return elapsed
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    random.seed(1)
+    keys = random.sample(range(n * 10), n)
+    ordered = sorted(keys)
+    print('{0:>14} {1:>10} {2:>10} {3:>10} {4:>10} {5:>10}'.format(
+        'map', 'insert s', 'search s', 'in-order s', 'find_ge s', 'delete s'))
+    for name, make in (('SkipListMap', SkipListMap), ('SortedTableMap', SortedTableMap), ('AVLTreeMap', AVLTreeMap)):
+        print('{0:>14} {1:>10.3f} {2:>10.3f} {3:>10.3f} {4:>10.3f} {5:>10.3f}'.format(name, *run(make, keys, ordered)))
+
+
+if __name__ == '__main__':
+    main()
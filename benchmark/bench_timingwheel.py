@@ -0,0 +1,84 @@
+"""
+TimingWheel against AdaptableHeapPriorityQueue for short-lived timers.
+
+    python benchmark/bench_timingwheel.py [timers] [per_tick]
+
+`timers` timeouts of 1 to 1000 ticks are scheduled, `per_tick` per tick,
+and most are cancelled before they fire, as request timeouts usually are.
+The heap version cancels with remove and fires by popping expired keys.
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'adt'))
+
+from queue import AdaptableHeapPriorityQueue, TimingWheel  # noqa: E402  (adt/queue, not the stdlib module)
+
+CANCEL_RATE = 0.9
+
+
+def noop():
+    pass
+
+
+def run_wheel(plan):
+    wheel = TimingWheel()
+    live = []
+    start = time.perf_counter()
+    for delays, cancels in plan:
+        for delay in delays:
+            live.append(wheel.schedule(delay, noop))
+        for j in cancels:
+            wheel.cancel(live[j])
+        wheel.tick()
+    wheel.advance(wheel.now + 1001)
+    return time.perf_counter() - start
+
+
+def run_heap(plan):
+    heap = AdaptableHeapPriorityQueue()
+    live = []
+    now = 0
+    start = time.perf_counter()
+    for delays, cancels in plan:
+        for delay in delays:
+            live.append(heap.add(now + delay, noop))
+        for j in cancels:
+            loc = live[j]
+            if loc is not None:
+                try:
+                    heap.remove(loc)
+                except ValueError:
+                    # already fired
+                    pass
+                live[j] = None
+        now += 1
+        while not heap.is_empty() and heap.min()[0] <= now:
+            heap.remove_min()[1]()
+    while not heap.is_empty():
+        heap.remove_min()[1]()
+    return time.perf_counter() - start
+
+
+def main():
+    timers = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    per_tick = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    rand = random.Random(1)
+    plan = []
+    scheduled = 0
+    while scheduled < timers:
+        delays = [rand.randrange(1, 1001) for _ in range(per_tick)]
+        # cancel timers scheduled a few ticks earlier
+        cancels = [rand.randrange(max(0, scheduled - 10 * per_tick), scheduled + per_tick)
+                   for _ in range(int(per_tick * CANCEL_RATE))]
+        plan.append((delays, cancels))
+        scheduled += per_tick
+    print('{0:>28} {1:>10}'.format('scheduler', 'time s'))
+    print('{0:>28} {1:>10.3f}'.format('AdaptableHeapPriorityQueue', run_heap(plan)))
+    print('{0:>28} {1:>10.3f}'.format('TimingWheel', run_wheel(plan)))
+
+
+if __name__ == '__main__':
+    main()